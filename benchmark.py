@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""
+OSINT Username Hunter - Offline Benchmark Suite
+Description: Measures search throughput and latency against a local fake-platform server
+
+Every catalog entry is pointed at a local HTTP server that imitates it
+with configurable latency, page sizes and status mixes (404, signature
+not-found pages, 403, 429, 5xx and slow-loris responses), so changes to
+concurrency, pooling or matching can be judged without touching real sites.
+
+Caching, rate limiting and circuit breakers are disabled for the run, and every search uses
+fresh usernames, so each check really goes over the wire.
+
+Run:
+python benchmark.py
+python benchmark.py --engine both --concurrency 10,50,200 --variations 1,5 --searches 5
+python benchmark.py --mix found=0.3,not_found=0.5,429=0.1,slowloris=0.1 --json bench.json
+"""
+
+import argparse
+import json
+import logging
+import math
+import os
+import random
+import re
+import sys
+import threading
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Benchmarks measure the network path, so keep the cache, rate limiter and breakers out of the way
+os.environ.setdefault('OSINT_CACHE_TTL_FOUND', '0')
+os.environ.setdefault('OSINT_CACHE_TTL_NOT_FOUND', '0')
+os.environ.setdefault('OSINT_CACHE_TTL_BLOCKED', '0')
+os.environ.setdefault('OSINT_CACHE_TTL_RATE_LIMITED', '0')
+os.environ.setdefault('OSINT_RATE_PER_PLATFORM', '1000000')
+os.environ.setdefault('OSINT_RATE_BURST', '1000000')
+os.environ.setdefault('OSINT_CIRCUIT_BREAKER', '0')
+os.environ.setdefault('OSINT_PLATFORMS_RELOAD', '0')  # Fake URLs are patched into the loaded catalog
+
+import osint_backend as backend  # noqa: E402 (must import after the environment overrides)
+
+DEFAULT_MIX = 'found=0.3,not_found=0.4,signature=0.15,403=0.05,429=0.05,5xx=0.05'
+OUTCOMES = ['found', 'not_found', 'signature', '403', '429', '5xx', 'slowloris']
+
+
+def parse_mix(text):
+    """Parse 'found=0.3,not_found=0.5,...' into normalized outcome weights"""
+    weights = {}
+    for part in text.split(','):
+        if not part.strip():
+            continue
+        name, _, value = part.partition('=')
+        name = name.strip()
+        if name not in OUTCOMES:
+            raise argparse.ArgumentTypeError(f'Unknown outcome "{name}", expected one of {", ".join(OUTCOMES)}')
+        weights[name] = float(value)
+    total = sum(weights.values())
+    if total <= 0:
+        raise argparse.ArgumentTypeError('Outcome mix must have a positive total weight')
+    return {name: weight / total for name, weight in weights.items()}
+
+
+def parse_int_list(text):
+    return [int(v) for v in text.split(',') if v.strip()]
+
+
+def slugify(platform_name):
+    return re.sub(r'[^a-z0-9]+', '-', platform_name.lower()).strip('-')
+
+
+class FakePlatformServer:
+    """Local HTTP servers that imitate every catalog entry.
+
+    Each platform gets its own port, so per-host connection pools and limits
+    behave as they would against separate sites. Requests to
+    /<platform-slug>/<username> get a response drawn from the outcome mix
+    after a log-normal latency delay (HEAD and ranged GETs included, so
+    probes are exercised). Found pages contain the
+    platform's exists signatures and signature pages its not-found text,
+    both padded to the configured page size.
+    """
+
+    def __init__(self, platforms, mix, latency_ms, latency_sigma, page_kb, seed=0):
+        self.mix = mix
+        self.latency_ms = latency_ms
+        self.latency_sigma = latency_sigma
+        self.page_bytes = int(page_kb * 1024)
+        self.random = random.Random(seed)
+        self.random_lock = threading.Lock()
+        self.signatures = {}
+        for category_platforms in platforms.values():
+            for platform_name, platform_info in category_platforms.items():
+                self.signatures[slugify(platform_name)] = platform_info
+        self.servers = []
+
+    def _draw(self):
+        with self.random_lock:
+            roll = self.random.random()
+            latency = self.latency_ms * math.exp(self.random.gauss(0, self.latency_sigma)) / 1000
+        for name, weight in self.mix.items():
+            roll -= weight
+            if roll <= 0:
+                return name, latency
+        return next(iter(self.mix)), latency
+
+    def _page(self, platform_info, outcome):
+        if outcome == 'found':
+            marker = ' '.join(platform_info.get('exists_signatures', [])[:3])
+        elif outcome == 'signature':
+            marker = (platform_info.get('not_found_signatures') or ['Page not found'])[0]
+        else:
+            marker = 'Not Found'
+        head = f'<html><head><title>{marker}</title></head><body><h1>{marker}</h1>'.encode()
+        filler = b'<div class="filler">lorem ipsum dolor sit amet</div>'
+        body = head + filler * max((self.page_bytes - len(head)) // len(filler), 0) + b'</body></html>'
+        return body
+
+    def start(self):
+        """Start one server per platform and return {platform slug: port}"""
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, *args):
+                pass
+
+            def _respond(self, send_body):
+                parts = self.path.strip('/').split('/', 1)
+                platform_info = server.signatures.get(parts[0], {})
+                outcome, latency = server._draw()
+                time.sleep(latency)
+
+                status = {'not_found': 404, '403': 403, '429': 429, '5xx': 503}.get(outcome, 200)
+                body = server._page(platform_info, outcome) if status == 200 else b'error'
+                content_range = None
+                match = re.fullmatch(r'bytes=(\d+)-(\d*)', self.headers.get('Range', ''))
+                if status == 200 and match and int(match.group(1)) < len(body):
+                    # Honour ranged GETs the way real sites do, so 'range' probes are measured
+                    start = int(match.group(1))
+                    end = min(int(match.group(2) or len(body) - 1), len(body) - 1)
+                    content_range = f'bytes {start}-{end}/{len(body)}'
+                    body = body[start:end + 1]
+                    status = 206
+                try:
+                    self.send_response(status)
+                    self.send_header('Content-Type', 'text/html; charset=utf-8')
+                    self.send_header('Content-Length', str(len(body)))
+                    if content_range:
+                        self.send_header('Content-Range', content_range)
+                    if status == 429:
+                        self.send_header('Retry-After', '1')
+                    self.end_headers()
+                    if not send_body:
+                        return
+                    if outcome == 'slowloris':
+                        # Trickle the page out one small piece at a time
+                        for i in range(0, len(body), 64):
+                            self.wfile.write(body[i:i + 64])
+                            self.wfile.flush()
+                            time.sleep(0.5)
+                    else:
+                        self.wfile.write(body)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+
+            def do_GET(self):
+                self._respond(True)
+
+            def do_HEAD(self):
+                self._respond(False)
+
+        ThreadingHTTPServer.request_queue_size = 1024
+        ports = {}
+        for slug in self.signatures:
+            httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+            httpd.daemon_threads = True
+            threading.Thread(target=httpd.serve_forever, name=f'fake-{slug}', daemon=True).start()
+            self.servers.append(httpd)
+            ports[slug] = httpd.server_address[1]
+        return ports
+
+    def stop(self):
+        for httpd in self.servers:
+            httpd.shutdown()
+            httpd.server_close()
+
+
+def point_platforms_at(ports):
+    """Rewrite every catalog URL template to hit its fake server"""
+    for category_platforms in backend.platform_registry.platforms.values():
+        for platform_name, platform_info in category_platforms.items():
+            slug = slugify(platform_name)
+            platform_info['url'] = f'http://127.0.0.1:{ports[slug]}/{slug}/{{0}}'
+            platform_info.pop('rate_limit', None)  # Per-platform pacing would dominate the timings
+
+
+def use_engine(engine_name, concurrency):
+    """Install a fresh engine of the given kind with the given concurrency"""
+    if engine_name == 'async':
+        if backend.aiohttp is None:
+            raise SystemExit('aiohttp is not installed, the async engine is unavailable')
+        if backend.async_engine is not None:
+            backend.async_engine.shutdown()
+        backend.async_engine = backend.AsyncVerificationEngine(max_concurrency=concurrency)
+        backend.USE_ASYNC_ENGINE = True
+    else:
+        backend.thread_engine = backend.ThreadVerificationEngine(max_workers=concurrency)
+        backend.USE_ASYNC_ENGINE = False
+
+
+def percentile(values, pct):
+    if not values:
+        return 0
+    ordered = sorted(values)
+    index = min(int(math.ceil(pct / 100 * len(ordered))) - 1, len(ordered) - 1)
+    return ordered[max(index, 0)]
+
+
+def run_search(username, variations):
+    """Run one search the way /api/search/stream does (two-wave expansion, search deadline) and time it"""
+    # Plain alphanumeric variants pass every platform's username rules, so each one costs a check everywhere
+    usernames_to_check = [username] + [f'{username}{i}' for i in range(1, variations)]
+    # Same expansion and deadline as the stream, so variations beyond VARIATION_BUDGET are never checked
+    expander = backend.VariationExpander(usernames_to_check)
+    deadline = backend.search_deadline({})
+    summary = backend.SearchSummary(username, usernames_to_check, variations > 1, keep_results=False)
+    latencies = []
+    statuses = {}
+
+    start = time.perf_counter()
+    first_result = None
+    for result in backend.iter_check_results(expander.first_wave, deadline, expander.follow_up):
+        if first_result is None:
+            first_result = time.perf_counter() - start
+        summary.add(result)
+        latencies.append(result['response_time'])
+        statuses[result['status']] = statuses.get(result['status'], 0) + 1
+    elapsed = time.perf_counter() - start
+
+    return {
+        'checks': len(latencies),
+        'elapsed': elapsed,
+        'time_to_first_result': first_result or elapsed,
+        'latencies': latencies,
+        'statuses': statuses
+    }
+
+
+def measure_memory(username, variations):
+    """Peak Python memory allocated while one search runs, in KB"""
+    tracemalloc.start()
+    try:
+        run_search(username, variations)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1024
+
+
+def run_benchmark(engine_name, concurrency, variations, searches, run_id):
+    use_engine(engine_name, concurrency)
+
+    # Warm up connections so the first measured search is not all handshakes
+    run_search(f'warmup{run_id}', 1)
+
+    runs = [run_search(f'bench{run_id}x{i}', variations) for i in range(searches)]
+    memory_kb = measure_memory(f'bench{run_id}mem', variations)
+
+    total_checks = sum(r['checks'] for r in runs)
+    total_elapsed = sum(r['elapsed'] for r in runs)
+    latencies = [ms for r in runs for ms in r['latencies']]
+    statuses = {}
+    for r in runs:
+        for status, count in r['statuses'].items():
+            statuses[status] = statuses.get(status, 0) + count
+
+    return {
+        'engine': engine_name,
+        'concurrency': concurrency,
+        'variations': variations,
+        'searches': searches,
+        'checks_per_second': round(total_checks / total_elapsed, 1) if total_elapsed else 0,
+        'search_seconds_avg': round(total_elapsed / searches, 3),
+        'latency_ms_p50': percentile(latencies, 50),
+        'latency_ms_p95': percentile(latencies, 95),
+        'latency_ms_p99': percentile(latencies, 99),
+        'time_to_first_result_ms_avg': int(sum(r['time_to_first_result'] for r in runs) / searches * 1000),
+        'memory_kb_per_search': round(memory_kb, 1),
+        'statuses': statuses
+    }
+
+
+def print_table(rows):
+    columns = [
+        ('engine', 'engine'), ('concurrency', 'conc'), ('variations', 'vars'),
+        ('checks_per_second', 'checks/s'), ('search_seconds_avg', 'search s'),
+        ('latency_ms_p50', 'p50 ms'), ('latency_ms_p95', 'p95 ms'), ('latency_ms_p99', 'p99 ms'),
+        ('time_to_first_result_ms_avg', 'ttfr ms'), ('memory_kb_per_search', 'mem KB')
+    ]
+    widths = [max(len(title), *(len(str(row[key])) for row in rows)) for key, title in columns]
+    print('  '.join(title.rjust(width) for (_, title), width in zip(columns, widths)))
+    for row in rows:
+        print('  '.join(str(row[key]).rjust(width) for (key, _), width in zip(columns, widths)))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Offline benchmark for OSINT Username Hunter')
+    parser.add_argument('--engine', choices=['async', 'threads', 'both'], default='async')
+    parser.add_argument('--concurrency', type=parse_int_list, default=[10, 50, 200],
+                        help='Comma-separated concurrency levels (async in-flight limit / thread count)')
+    parser.add_argument('--variations', type=parse_int_list, default=[1, 5],
+                        help='Comma-separated usernames per search')
+    parser.add_argument('--searches', type=int, default=3, help='Searches per configuration')
+    parser.add_argument('--latency-ms', type=float, default=150, help='Median fake platform latency')
+    parser.add_argument('--latency-sigma', type=float, default=0.5, help='Log-normal latency spread')
+    parser.add_argument('--page-kb', type=float, default=200, help='Size of 200 OK pages')
+    parser.add_argument('--mix', type=parse_mix, default=parse_mix(DEFAULT_MIX),
+                        help=f'Outcome weights, from {", ".join(OUTCOMES)} (default: {DEFAULT_MIX})')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', help='Also write the results to this JSON file')
+    args = parser.parse_args(argv)
+
+    logging.getLogger('osint_backend').setLevel(logging.ERROR)
+
+    server = FakePlatformServer(backend.platform_registry.platforms, args.mix, args.latency_ms, args.latency_sigma, args.page_kb, args.seed)
+    ports = server.start()
+    point_platforms_at(ports)
+
+    engines = ['async', 'threads'] if args.engine == 'both' else [args.engine]
+    platform_count = len(backend.platform_registry)
+    print(f"Fake platforms on 127.0.0.1:{min(ports.values())}-{max(ports.values())} ({platform_count} platforms, "
+          f"median latency {args.latency_ms:.0f}ms, pages {args.page_kb:.0f}KB)")
+
+    rows = []
+    try:
+        for engine_name in engines:
+            for concurrency in args.concurrency:
+                for variations in args.variations:
+                    rows.append(run_benchmark(engine_name, concurrency, variations, args.searches, len(rows)))
+                    print(f"  {engine_name} c={concurrency} v={variations}: "
+                          f"{rows[-1]['checks_per_second']} checks/s", file=sys.stderr)
+    finally:
+        server.stop()
+
+    print_table(rows)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'config': {k: v for k, v in vars(args).items() if k != 'json'}, 'results': rows}, f, indent=2)
+    return rows
+
+
+if __name__ == '__main__':
+    main()
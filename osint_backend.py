@@ -5,7 +5,7 @@ Author: Your Name
 Description: Backend API for verifying username existence across multiple platforms
 
 Installation:
-pip install flask flask-cors requests beautifulsoup4 user-agent
+pip install flask flask-cors requests beautifulsoup4 user-agent aiohttp orjson brotli
 
 Run:
 python osint_backend.py
@@ -14,15 +14,55 @@ python osint_backend.py
 from flask import Flask, request, jsonify
 from flask_cors import CORS
 import requests
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from concurrent.futures import InvalidStateError
 from bs4 import BeautifulSoup
+import asyncio
+import atexit
+import codecs
+import gzip
+import hashlib
+import heapq
+import itertools
+import json
+import re
+import socket
+import sqlite3
+import threading
 import time
+import uuid
 import random
 import logging
+import math
+import multiprocessing
 import os
-from flask import Flask, request, jsonify, send_from_directory
+import zlib
+from collections import OrderedDict, defaultdict, deque
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from functools import partial
+from http.cookiejar import DefaultCookiePolicy
+from queue import Empty, SimpleQueue
+from urllib.parse import urlparse
+from flask import Flask, request, jsonify, send_from_directory, Response, stream_with_context
 
+# Try to import aiohttp for the async verification engine, fallback to threads
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# Optional faster JSON encoder and brotli compression for large responses
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
+try:
+    import brotli
+except ImportError:
+    brotli = None
 
 # Try to import user-agent, fallback to manual user agents
 try:
@@ -47,147 +87,465 @@ def serve_frontend():
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Comprehensive platform database with verification signatures
-PLATFORMS = {
-    'Social Media': {
-        'GitHub': {
-            'url': 'https://github.com/{0}',
-            'not_found_signatures': ['Not Found', 'Page not found', 'This is not the web page you are looking for'],
-            'exists_signatures': ['Profile', 'repositories', 'contributions', 'followers', 'following']
-        },
-        'Instagram': {
-            'url': 'https://www.instagram.com/{0}/',
-            'not_found_signatures': ['Page Not Found', 'Sorry, this page isn\'t available', 'The link you followed may be broken'],
-            'exists_signatures': ['posts', 'followers', 'following', 'Posts', 'Followers', 'Following']
-        },
-        'Twitter/X': {
-            'url': 'https://twitter.com/{0}',
-            'not_found_signatures': ['This account doesn\'t exist', 'Account suspended', 'page doesn\'t exist'],
-            'exists_signatures': ['Tweets', 'Following', 'Followers', 'tweets', 'following', 'followers']
-        },
-        'Facebook': {
-            'url': 'https://facebook.com/{0}',
-            'not_found_signatures': ['Page Not Found', 'Content Not Found', 'This content isn\'t available'],
-            'exists_signatures': ['Posts', 'Photos', 'About', 'posts', 'photos', 'about']
-        },
-        'LinkedIn': {
-            'url': 'https://linkedin.com/in/{0}',
-            'not_found_signatures': ['Page not found', 'This profile was not found'],
-            'exists_signatures': ['Experience', 'Education', 'connections', 'experience', 'education']
-        },
-        'TikTok': {
-            'url': 'https://tiktok.com/@{0}',
-            'not_found_signatures': ['Couldn\'t find this account', 'User not found'],
-            'exists_signatures': ['Following', 'Followers', 'Likes', 'following', 'followers', 'likes']
-        },
-        'Reddit': {
-            'url': 'https://reddit.com/user/{0}',
-            'not_found_signatures': ['page not found', 'there doesn\'t seem to be anything here', 'Sorry, nobody on Reddit goes by that name'],
-            'exists_signatures': ['Post Karma', 'Comment Karma', 'Trophy Case', 'post karma', 'comment karma']
-        },
-        'Pinterest': {
-            'url': 'https://pinterest.com/{0}',
-            'not_found_signatures': ['Page not found', 'Sorry, we couldn\'t find that page'],
-            'exists_signatures': ['followers', 'following', 'pins', 'Followers', 'Following', 'Pins']
-        }
-    },
-    'Developer Platforms': {
-        'GitLab': {
-            'url': 'https://gitlab.com/{0}',
-            'not_found_signatures': ['404 Not Found', 'Page Not Found', 'The page you\'re looking for could not be found'],
-            'exists_signatures': ['Projects', 'Activity', 'Groups', 'projects', 'activity', 'groups']
-        },
-        'CodePen': {
-            'url': 'https://codepen.io/{0}',
-            'not_found_signatures': ['Page not found', '404 Not Found'],
-            'exists_signatures': ['Pens', 'Posts', 'Collections', 'pens', 'posts', 'collections']
-        },
-        'Stack Overflow': {
-            'url': 'https://stackoverflow.com/users/{0}',
-            'not_found_signatures': ['User not found', 'Page Not Found'],
-            'exists_signatures': ['reputation', 'answers', 'questions', 'Reputation', 'Answers', 'Questions']
-        },
-        'Replit': {
-            'url': 'https://replit.com/@{0}',
-            'not_found_signatures': ['Page not found', 'User not found'],
-            'exists_signatures': ['Repls', 'Posts', 'Comments', 'repls', 'posts', 'comments']
-        }
-    },
-    'Gaming': {
-        'Steam': {
-            'url': 'https://steamcommunity.com/id/{0}',
-            'not_found_signatures': ['No profile could be found', 'The specified profile could not be found'],
-            'exists_signatures': ['Level', 'Games', 'Screenshots', 'level', 'games', 'screenshots']
-        },
-        'Twitch': {
-            'url': 'https://twitch.tv/{0}',
-            'not_found_signatures': ['Sorry. Unless you\'ve got a time machine', 'Page Not Found'],
-            'exists_signatures': ['Videos', 'Clips', 'About', 'videos', 'clips', 'about']
-        }
-    },
-    'Professional': {
-        'Behance': {
-            'url': 'https://behance.net/{0}',
-            'not_found_signatures': ['Page not found', '404 - Page not found'],
-            'exists_signatures': ['Projects', 'Appreciations', 'Views', 'projects', 'appreciations', 'views']
-        },
-        'Dribbble': {
-            'url': 'https://dribbble.com/{0}',
-            'not_found_signatures': ['Page not found', 'Whoops, that page is gone'],
-            'exists_signatures': ['Shots', 'Projects', 'Likes', 'shots', 'projects', 'likes']
-        },
-        'Medium': {
-            'url': 'https://medium.com/@{0}',
-            'not_found_signatures': ['Page not found', 'User not found'],
-            'exists_signatures': ['Stories', 'Following', 'Followers', 'stories', 'following', 'followers']
-        }
-    },
-    'Creative': {
-        'YouTube': {
-            'url': 'https://youtube.com/@{0}',
-            'not_found_signatures': ['This channel doesn\'t exist', 'Page not found'],
-            'exists_signatures': ['subscribers', 'videos', 'Home', 'Subscribers', 'Videos']
-        },
-        'SoundCloud': {
-            'url': 'https://soundcloud.com/{0}',
-            'not_found_signatures': ['Page not found', 'Sorry! Something went wrong'],
-            'exists_signatures': ['followers', 'following', 'tracks', 'Followers', 'Following', 'Tracks']
-        },
-        'DeviantArt': {
-            'url': 'https://{0}.deviantart.com',
-            'not_found_signatures': ['Page Not Found', 'The page you were looking for doesn\'t exist'],
-            'exists_signatures': ['Deviations', 'Gallery', 'Favourites', 'deviations', 'gallery', 'favourites']
-        }
-    }
+# Verification engine settings
+USE_ASYNC_ENGINE = os.environ.get('OSINT_ASYNC_ENGINE', '1') != '0'
+MAX_CONCURRENCY = int(os.environ.get('OSINT_MAX_CONCURRENCY', 200))  # Global in-flight checks per worker
+THREAD_POOL_WORKERS = int(os.environ.get('OSINT_THREAD_WORKERS', 10))  # Used by the sync fallback only
+CHECK_TIMEOUT = float(os.environ.get('OSINT_CHECK_TIMEOUT', 10))  # Seconds allowed for a single platform check
+WORKER_MODE = os.environ.get('OSINT_WORKER_MODE', 'inline')  # 'process' shards checks across child processes by host
+WORKER_PROCESSES = int(os.environ.get('OSINT_WORKER_PROCESSES', os.cpu_count() or 1))  # Shards in process mode
+SEARCH_DEADLINE = float(os.environ.get('OSINT_SEARCH_DEADLINE', 25))  # Overall budget per search, below gunicorn's 30s timeout
+
+# Platform catalog settings
+PLATFORMS_FILE = os.environ.get('OSINT_PLATFORMS_FILE', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'platforms.json'))
+PLATFORMS_RELOAD_INTERVAL = float(os.environ.get('OSINT_PLATFORMS_RELOAD', 5))  # Seconds between file change checks, 0 disables
+
+# Variation settings
+MAX_VARIATIONS = int(os.environ.get('OSINT_MAX_VARIATIONS', 5))  # Usernames checked per platform when variations are on
+VARIATION_BUDGET = int(os.environ.get('OSINT_VARIATION_BUDGET', 60))  # Extra requests a search may spend on variations
+
+# Adaptive timeout settings (per-platform timeouts sized from recent response times)
+ADAPTIVE_TIMEOUTS = os.environ.get('OSINT_ADAPTIVE_TIMEOUTS', '1') != '0'
+LATENCY_WINDOW = int(os.environ.get('OSINT_LATENCY_WINDOW', 200))  # Recent response times kept per platform
+LATENCY_MIN_SAMPLES = int(os.environ.get('OSINT_LATENCY_MIN_SAMPLES', 40))  # Use CHECK_TIMEOUT until a platform has this many
+LATENCY_MAX_TIMEOUT_RATE = 0.05  # Above this share of recent checks timing out, the p95 is unknown: use CHECK_TIMEOUT
+TIMEOUT_P95_MULTIPLIER = float(os.environ.get('OSINT_TIMEOUT_P95_MULTIPLIER', 3.0))
+TIMEOUT_MIN = float(os.environ.get('OSINT_TIMEOUT_MIN', 2.0))
+TIMEOUT_MAX = float(os.environ.get('OSINT_TIMEOUT_MAX', CHECK_TIMEOUT))
+HEDGE_REQUESTS = os.environ.get('OSINT_HEDGE_REQUESTS', '0') == '1'  # Async engine only
+
+# Circuit breaker settings (stop sending checks to platforms that keep failing)
+CIRCUIT_BREAKER = os.environ.get('OSINT_CIRCUIT_BREAKER', '1') != '0'
+BREAKER_FAILURE_THRESHOLD = int(os.environ.get('OSINT_BREAKER_THRESHOLD', 5))  # Consecutive failures that open a breaker
+BREAKER_COOLDOWN = float(os.environ.get('OSINT_BREAKER_COOLDOWN', 30))  # Seconds open before a half-open trial check
+BREAKER_FAILURE_STATUSES = ('blocked', 'error', 'timeout', 'connection_error')
+
+# Connection pool settings (shared keep-alive connections per platform host)
+POOL_CONNECTIONS_PER_HOST = int(os.environ.get('OSINT_POOL_PER_HOST', 10))
+POOL_HOSTS_PER_SESSION = 4  # Redirect targets (e.g. twitter.com -> x.com) keep their own pool in a platform's session
+POOL_IDLE_TIMEOUT = float(os.environ.get('OSINT_POOL_IDLE_TIMEOUT', 60))  # Seconds before idle pools are closed
+
+# Page scanning settings
+MAX_BODY_BYTES = int(os.environ.get('OSINT_MAX_BODY_BYTES', 512 * 1024))  # Stop reading a page after this many bytes
+BODY_CHUNK_SIZE = 16 * 1024
+PROBE_RANGE_BYTES = int(os.environ.get('OSINT_PROBE_RANGE_BYTES', 16 * 1024))  # Page head fetched by 'range' probes
+
+# Rate limiting settings (per-platform token buckets; catalog entries may override via 'rate_limit')
+RATE_LIMIT_DEFAULT_RATE = float(os.environ.get('OSINT_RATE_PER_PLATFORM', 2.0))  # Requests per second
+RATE_LIMIT_DEFAULT_BURST = float(os.environ.get('OSINT_RATE_BURST', 5))
+RATE_LIMIT_BACKOFF_BASE = 2.0  # Seconds, doubled on each consecutive 429 without Retry-After
+RATE_LIMIT_BACKOFF_MAX = 60.0
+
+# Bulk job settings
+JOBS_DB_PATH = os.environ.get('OSINT_JOBS_DB', 'osint_jobs.db')
+JOB_CONCURRENCY = int(os.environ.get('OSINT_JOB_CONCURRENCY', 50))  # Job checks in flight per worker
+JOB_MAX_USERNAMES = int(os.environ.get('OSINT_JOB_MAX_USERNAMES', 10000))
+JOB_CLAIM_TIMEOUT = 600  # Seconds before a running check from a dead worker is handed out again
+JOB_POLL_INTERVAL = 1.0
+
+# Watchlist settings (re-check intervals in seconds)
+WATCHLIST_DB_PATH = os.environ.get('OSINT_WATCHLIST_DB', 'osint_watchlist.db')
+WATCHLIST_INTERVAL = int(os.environ.get('OSINT_WATCHLIST_INTERVAL', 20 * 3600))  # Doubled while a status stays unchanged
+WATCHLIST_MAX_INTERVAL = int(os.environ.get('OSINT_WATCHLIST_MAX_INTERVAL', 7 * 86400))
+WATCHLIST_RETRY_INTERVAL = int(os.environ.get('OSINT_WATCHLIST_RETRY_INTERVAL', 3600))  # After checks that got no answer
+WATCHLIST_BATCH = int(os.environ.get('OSINT_WATCHLIST_BATCH', 200))
+
+# Result encoding settings
+RESULT_FORMATS = ('full', 'compact')
+RESULTS_PAGE_MAX = 1000
+SEARCH_RESULTS_KEEP = int(os.environ.get('OSINT_SEARCH_RESULTS_KEEP', 200))  # Recent searches kept for paging, per worker
+SEARCH_RESULTS_TTL = int(os.environ.get('OSINT_SEARCH_RESULTS_TTL', 900))
+COMPRESS_MIN_BYTES = int(os.environ.get('OSINT_COMPRESS_MIN_BYTES', 1024))  # Smaller responses are sent uncompressed
+COMPRESS_GZIP_LEVEL = 5
+COMPRESS_BROTLI_QUALITY = 5
+
+# Result cache settings (TTL in seconds per result status, 0 = never cached)
+CACHE_MAX_ENTRIES = int(os.environ.get('OSINT_CACHE_SIZE', 10000))
+CACHE_DB_PATH = os.environ.get('OSINT_CACHE_DB')  # Optional SQLite file shared by all workers
+CACHE_DB_PRUNE_INTERVAL = 300  # Seconds between deletes of expired rows from the SQLite cache
+CACHE_TTLS = {
+    'found': int(os.environ.get('OSINT_CACHE_TTL_FOUND', 3600)),
+    'likely_exists': int(os.environ.get('OSINT_CACHE_TTL_FOUND', 3600)),
+    'not_found': int(os.environ.get('OSINT_CACHE_TTL_NOT_FOUND', 1800)),
+    'blocked': int(os.environ.get('OSINT_CACHE_TTL_BLOCKED', 300)),
+    'rate_limited': int(os.environ.get('OSINT_CACHE_TTL_RATE_LIMITED', 30)),
+    'timeout': 0,
+    'connection_error': 0,
+    'error': 0,
+    'cut_short': 0,
+    'skipped_unavailable': 0,
+    'not_modified': 0
 }
 
-def generate_variations(username):
-    """Generate common username variations"""
-    variations = {username}  # Use set to avoid duplicates
+# Metrics settings (histogram buckets in seconds)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+class Metric:
+    """A labelled Prometheus counter, gauge or histogram kept in process memory"""
     
-    # Basic variations
-    variations.add(username.lower())
-    variations.add(username.upper())
-    variations.add(username.replace('.', ''))
-    variations.add(username.replace('_', ''))
-    variations.add(username.replace('-', ''))
-    variations.add(username.replace(' ', ''))
+    def __init__(self, name, help_text, kind, label_names=(), buckets=None):
+        self.name = name
+        self.help_text = help_text
+        self.kind = kind
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(buckets) if buckets else ()
+        self._lock = threading.Lock()
+        self._values = {}  # label values -> number, or [bucket counts..., sum, count] for histograms
     
-    # Common suffixes
-    for suffix in ['1', '123', '2023', '2024']:
-        variations.add(username + suffix)
+    def _key(self, labels):
+        return tuple(str(labels.get(name, '')) for name in self.label_names)
     
-    # Common prefixes/suffixes
-    variations.add('_' + username)
-    variations.add(username + '_')
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
     
-    return list(variations)[:5]  # Limit to prevent excessive requests
+    def dec(self, amount=1, **labels):
+        self.inc(-amount, **labels)
+    
+    def set(self, value, **labels):
+        with self._lock:
+            self._values[self._key(labels)] = value
+    
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            series = self._values.get(key)
+            if series is None:
+                series = self._values[key] = [0] * (len(self.buckets) + 2)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+            series[-2] += value
+            series[-1] += 1
+    
+    def _labels_text(self, key, extra=()):
+        pairs = list(zip(self.label_names, key)) + list(extra)
+        if not pairs:
+            return ''
+        escaped = (str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for _, value in pairs)
+        return '{' + ','.join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + '}'
+    
+    def render(self):
+        lines = [f'# HELP {self.name} {self.help_text}', f'# TYPE {self.name} {self.kind}']
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            if self.kind != 'histogram':
+                lines.append(f'{self.name}{self._labels_text(key)} {value}')
+                continue
+            for bound, count in zip(self.buckets, value):
+                lines.append(f'{self.name}_bucket{self._labels_text(key, [("le", bound)])} {count}')
+            lines.append(f'{self.name}_bucket{self._labels_text(key, [("le", "+Inf")])} {value[-1]}')
+            lines.append(f'{self.name}_sum{self._labels_text(key)} {round(value[-2], 6)}')
+            lines.append(f'{self.name}_count{self._labels_text(key)} {value[-1]}')
+        return lines
 
-def verify_profile(username, platform_name, platform_info, timeout=10):
-    """Verify if a profile exists on a platform"""
-    url = platform_info['url'].format(username)
+class MetricsRegistry:
+    """Holds every metric and renders them in the Prometheus text format.
+    
+    Values are per process; with several gunicorn workers, scrape each
+    worker or aggregate the series by instance.
+    """
+    
+    def __init__(self):
+        self._metrics = []
+    
+    def _add(self, metric):
+        self._metrics.append(metric)
+        return metric
+    
+    def counter(self, name, help_text, label_names=()):
+        return self._add(Metric(name, help_text, 'counter', label_names))
+    
+    def gauge(self, name, help_text, label_names=()):
+        return self._add(Metric(name, help_text, 'gauge', label_names))
+    
+    def histogram(self, name, help_text, label_names=(), buckets=LATENCY_BUCKETS):
+        return self._add(Metric(name, help_text, 'histogram', label_names, buckets))
+    
+    def render(self):
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+metrics = MetricsRegistry()
+CHECK_DURATION = metrics.histogram('osint_check_duration_seconds', 'Platform check latency', ('platform', 'status'))
+CHECK_PHASE_DURATION = metrics.histogram('osint_check_phase_seconds', 'Time spent in each phase of a check', ('phase',))
+CHECKS_IN_FLIGHT = metrics.gauge('osint_checks_in_flight', 'Checks currently sending or reading a response', ('engine',))
+CHECKS_WAITING = metrics.gauge('osint_checks_waiting', 'Checks waiting for a rate limit slot or a free worker', ('engine',))
+ENGINE_CAPACITY = metrics.gauge('osint_engine_capacity', 'Maximum concurrent checks per engine', ('engine',))
+ENGINE_SATURATION = metrics.gauge('osint_engine_saturation', 'Fraction of engine capacity in use', ('engine',))
+POOL_CONNECTIONS = metrics.gauge('osint_pool_connections_opened', 'Connections opened per host by the connection pool', ('host',))
+RATE_LIMITED_TOTAL = metrics.counter('osint_rate_limited_total', 'HTTP 429 responses', ('platform',))
+TIMEOUTS_TOTAL = metrics.counter('osint_timeouts_total', 'Checks that timed out', ('platform',))
+BREAKER_STATE = metrics.gauge('osint_circuit_breaker_state', 'Circuit breaker state per platform (0 closed, 1 half-open, 2 open)', ('platform',))
+CHECKS_SKIPPED_TOTAL = metrics.counter('osint_checks_skipped_total', 'Checks skipped because the platform circuit breaker was open', ('platform',))
+HEDGES_TOTAL = metrics.counter('osint_hedged_requests_total', 'Hedged second requests by whether they answered first', ('platform', 'outcome'))
+CHECKS_CUT_SHORT_TOTAL = metrics.counter('osint_checks_cut_short_total', 'Checks stopped by the search deadline', ('platform',))
+CHECKS_COALESCED_TOTAL = metrics.counter('osint_checks_coalesced_total', 'Checks attached to an identical check already in flight', ('platform',))
+CACHE_REQUESTS_TOTAL = metrics.counter('osint_cache_requests_total', 'Result cache lookups', ('result',))
+PROBES_TOTAL = metrics.counter('osint_probes_total', 'Status-only probes by whether they settled the check', ('probe', 'outcome'))
+SEARCHES_TOTAL = metrics.counter('osint_searches_total', 'Searches started', ('endpoint',))
+
+def observe_phases(timings):
+    """Record per-phase check timings (seconds) in the phase histogram"""
+    for phase, seconds in timings.items():
+        if seconds is not None and seconds >= 0:
+            CHECK_PHASE_DURATION.observe(seconds, phase=phase)
+
+# Platform catalog with verification signatures, loaded from PLATFORMS_FILE:
+#   {category: {platform_name: {'url': template with {0}, 'not_found_signatures': [...], 'exists_signatures': [...]}}}
+# Optional per-platform tuning:
+#   'rate_limit': {'rate': requests per second, 'burst': bucket size}
+#   'probe': 'head'  - status code is authoritative; try a HEAD request before any GET
+#   'probe': 'range' - request only the first PROBE_RANGE_BYTES and settle not-found pages from them
+#   'username': {'pattern': allowed usernames, 'min_length', 'max_length', 'case_sensitive': default false}
+# Loading adds 'username_pattern', the compiled 'username.pattern', to each entry that has one.
+PROBE_MODES = (None, 'head', 'range')
+
+def is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+def validate_platform(platform_name, platform_info):
+    """Raise ValueError if a catalog entry cannot be checked; compiles its username pattern onto the entry"""
+    if not isinstance(platform_info, dict):
+        raise ValueError(f"{platform_name}: entry must be an object")
+    url = platform_info.get('url')
+    if not isinstance(url, str) or '{0}' not in url:
+        raise ValueError(f"{platform_name}: 'url' must be a template containing {{0}}")
+    for key in ('not_found_signatures', 'exists_signatures'):
+        signatures = platform_info.get(key, [])
+        if not isinstance(signatures, list) or not all(isinstance(s, str) and s for s in signatures):
+            raise ValueError(f"{platform_name}: '{key}' must be a list of non-empty strings")
+    if platform_info.get('probe') not in PROBE_MODES:
+        raise ValueError(f"{platform_name}: 'probe' must be one of {PROBE_MODES[1:]}")
+    limits = platform_info.get('rate_limit', {})
+    if not isinstance(limits, dict):
+        raise ValueError(f"{platform_name}: 'rate_limit' must be an object")
+    if 'rate' in limits and not (is_number(limits['rate']) and limits['rate'] > 0):
+        raise ValueError(f"{platform_name}: 'rate_limit.rate' must be a number above 0")
+    if 'burst' in limits and not (is_number(limits['burst']) and limits['burst'] >= 1):
+        raise ValueError(f"{platform_name}: 'rate_limit.burst' must be a number of at least 1")
+    rules = platform_info.get('username', {})
+    if not isinstance(rules, dict):
+        raise ValueError(f"{platform_name}: 'username' must be an object")
+    for key in ('min_length', 'max_length'):
+        if key in rules and not (isinstance(rules[key], int) and not isinstance(rules[key], bool) and rules[key] >= 1):
+            raise ValueError(f"{platform_name}: 'username.{key}' must be a positive integer")
+    if rules.get('min_length', 1) > rules.get('max_length', rules.get('min_length', 1)):
+        raise ValueError(f"{platform_name}: 'username.min_length' is above 'username.max_length'")
+    if not isinstance(rules.get('case_sensitive', False), bool):
+        raise ValueError(f"{platform_name}: 'username.case_sensitive' must be true or false")
+    if 'pattern' in rules:
+        if not isinstance(rules['pattern'], str):
+            raise ValueError(f"{platform_name}: 'username.pattern' must be a string")
+        try:
+            platform_info['username_pattern'] = re.compile(rules['pattern'])
+        except re.error as e:
+            raise ValueError(f"{platform_name}: bad username pattern: {e}")
+
+class PlatformRegistry:
+    """Platform catalog loaded from a JSON file and reloaded when the file changes.
+    
+    Loading validates every entry and builds a flat name index and check
+    list, so lookups and check building never walk the category tree.
+    Signature matchers are compiled on first use rather than at load, which
+    keeps startup and reloads fast for catalogs of thousands of sites.
+    maybe_reload() checks the file's mtime at most every
+    PLATFORMS_RELOAD_INTERVAL seconds; a file that fails to parse or
+    validate is logged and the previous catalog stays in use.
+    """
+    
+    def __init__(self, path=PLATFORMS_FILE, reload_interval=PLATFORMS_RELOAD_INTERVAL):
+        self.path = path
+        self.reload_interval = reload_interval
+        self.reloads = 0
+        self._lock = threading.Lock()
+        self._mtime = None
+        self._checked = 0.0
+        self.platforms = {}  # category -> {platform_name: platform_info}
+        self.index = {}  # platform_name -> (category, platform_info)
+        self.entries = []  # [(category, platform_name, platform_info)] in catalog order
+        self.load()
+    
+    def load(self):
+        """Read and validate the catalog file, replacing the current catalog"""
+        mtime = os.stat(self.path).st_mtime_ns
+        with open(self.path, encoding='utf-8') as f:
+            platforms = json.load(f)
+        
+        index = {}
+        entries = []
+        for category, category_platforms in platforms.items():
+            for platform_name, platform_info in category_platforms.items():
+                validate_platform(platform_name, platform_info)
+                if platform_name in index:
+                    raise ValueError(f"{platform_name}: listed in both {index[platform_name][0]} and {category}")
+                index[platform_name] = (category, platform_info)
+                entries.append((category, platform_name, platform_info))
+        
+        with self._lock:
+            self.platforms, self.index, self.entries = platforms, index, entries
+            self._mtime = mtime
+        logger.info(f"Loaded {len(entries)} platforms from {self.path}")
     
-    result = {
+    def maybe_reload(self):
+        """Reload the catalog if the file changed since it was last checked"""
+        now = time.monotonic()
+        with self._lock:
+            if self.reload_interval <= 0 or now - self._checked < self.reload_interval:
+                return
+            self._checked = now
+        try:
+            if os.stat(self.path).st_mtime_ns == self._mtime:
+                return
+            self.load()
+            self.reloads += 1
+        except (OSError, ValueError) as e:
+            # json.JSONDecodeError is a ValueError; keep serving the last good catalog
+            logger.error(f"Platform catalog reload failed, keeping previous catalog: {e}")
+            with self._lock:
+                self._mtime = None if isinstance(e, OSError) else os.stat(self.path).st_mtime_ns
+    
+    def __len__(self):
+        return len(self.entries)
+
+platform_registry = PlatformRegistry()
+
+def iter_variations(username):
+    """Yield common username variations lazily, most likely first, without duplicates"""
+    year = time.localtime().tm_year
+    candidates = itertools.chain(
+        [username, username.lower()],
+        (username.replace(separator, '') for separator in ('_', '.', '-', ' ')),
+        (username + suffix for suffix in ('1', '_')),
+        ['_' + username],
+        (username + suffix for suffix in ('123', str(year), str(year - 1))),
+        [username.upper()]
+    )
+    seen = set()
+    for candidate in candidates:
+        if candidate and candidate not in seen:
+            seen.add(candidate)
+            yield candidate
+
+def generate_variations(username, limit=None):
+    """Generate common username variations, ranked most likely first"""
+    return list(itertools.islice(iter_variations(username), limit))
+
+def accepts_username(platform_info, username):
+    """Whether a username passes a platform's 'username' rules (length and allowed characters)"""
+    rules = platform_info.get('username')
+    if not rules:
+        return True
+    if not rules.get('min_length', 1) <= len(username) <= rules.get('max_length', len(username)):
+        return False
+    # Compiled once at catalog load; entries built outside the registry compile here
+    pattern = platform_info.get('username_pattern')
+    if pattern is None and 'pattern' in rules:
+        pattern = platform_info['username_pattern'] = re.compile(rules['pattern'])
+    return pattern is None or pattern.fullmatch(username) is not None
+
+def platform_usernames(platform_info, usernames_to_check, limit=MAX_VARIATIONS):
+    """The first usernames a platform would accept, skipping case duplicates where it ignores case"""
+    case_sensitive = (platform_info.get('username') or {}).get('case_sensitive', False)
+    accepted = []
+    seen = set()
+    for username in usernames_to_check:
+        key = username if case_sensitive else username.lower()
+        if key in seen or not accepts_username(platform_info, username):
+            continue
+        seen.add(key)
+        accepted.append(username)
+        if len(accepted) >= limit:
+            break
+    return accepted
+
+class SignatureMatcher:
+    """Precompiled multi-pattern matcher for one platform's page signatures.
+    
+    All not-found and exists signatures are folded into a single
+    case-insensitive regex wrapped in a lookahead, so one pass over a chunk
+    reports every signature occurring in it, overlapping ones included.
+    """
+    
+    def __init__(self, platform_info):
+        self.source = platform_info
+        self.not_found_signatures = list(platform_info.get('not_found_signatures', []))
+        self.exists_signatures = list(platform_info.get('exists_signatures', []))
+        
+        # Longest first, so a pattern that is a prefix of another is implied by it below
+        patterns = sorted({s.lower() for s in self.not_found_signatures + self.exists_signatures}, key=len, reverse=True)
+        self.implied = {p: [q for q in patterns if q in p] for p in patterns}
+        self.not_found_patterns = {s.lower() for s in self.not_found_signatures}
+        self.overlap = max((len(p) for p in patterns), default=1) - 1
+        self.regex = None
+        if patterns:
+            self.regex = re.compile('(?=(' + '|'.join(re.escape(p) for p in patterns) + '))', re.IGNORECASE)
+
+class SignatureScan:
+    """Incremental scan of a response body against a SignatureMatcher.
+    
+    feed() takes raw body chunks and returns True once scanning can stop:
+    either a not-found signature matched (decisive) or MAX_BODY_BYTES were read.
+    """
+    
+    def __init__(self, matcher, encoding=None):
+        self.matcher = matcher
+        self.seen = set()
+        self.bytes_read = 0
+        self.match_seconds = 0.0
+        self.not_found_signature = None
+        self._tail = ''
+        try:
+            self._decoder = codecs.getincrementaldecoder(encoding or 'utf-8')(errors='replace')
+        except LookupError:
+            self._decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    
+    def _scan_text(self, text):
+        if self.matcher.regex is None or not text:
+            return False
+        # Keep the end of the previous chunk so signatures split across chunks still match
+        window = self._tail + text
+        for match in self.matcher.regex.finditer(window):
+            self.seen.update(self.matcher.implied.get(match.group(1).lower(), ()))
+        self._tail = window[-self.matcher.overlap:] if self.matcher.overlap else ''
+        
+        if self.seen & self.matcher.not_found_patterns:
+            self.not_found_signature = next(s for s in self.matcher.not_found_signatures if s.lower() in self.seen)
+            return True
+        return False
+    
+    def feed(self, chunk):
+        self.bytes_read += len(chunk)
+        started = time.perf_counter()
+        decisive = self._scan_text(self._decoder.decode(chunk))
+        self.match_seconds += time.perf_counter() - started
+        return decisive or self.bytes_read >= MAX_BODY_BYTES
+    
+    def finish(self):
+        started = time.perf_counter()
+        self._scan_text(self._decoder.decode(b'', final=True))
+        self.match_seconds += time.perf_counter() - started
+    
+    @property
+    def found_signatures(self):
+        return [s for s in self.matcher.exists_signatures if s.lower() in self.seen]
+
+SIGNATURE_MATCHERS = {}  # platform_name -> SignatureMatcher, compiled on first check
+
+def get_signature_matcher(platform_name, platform_info):
+    """Return the compiled matcher for a platform, recompiling when its catalog entry was replaced"""
+    matcher = SIGNATURE_MATCHERS.get(platform_name)
+    if matcher is None or matcher.source is not platform_info:
+        matcher = SIGNATURE_MATCHERS[platform_name] = SignatureMatcher(platform_info)
+    return matcher
+
+def new_result(username, platform_name, url):
+    """Create an empty verification result for a platform check"""
+    return {
         'platform': platform_name,
         'username': username,
         'url': url,
@@ -196,9 +554,37 @@ def verify_profile(username, platform_name, platform_info, timeout=10):
         'confidence': 0,
         'note': ''
     }
-    
+
+# Statuses where the platform never gave an answer
+UNANSWERED_STATUSES = ('timeout', 'connection_error', 'error', 'cut_short', 'skipped_unavailable')
+
+def check_budget(timeout, deadline):
+    """Per-check timeout clipped to what is left of the search deadline (a monotonic time, or None)"""
+    if deadline is None:
+        return timeout
+    return min(timeout, deadline - time.monotonic())
+
+def mark_cut_short(result, note):
+    """Mark a check the search deadline stopped from finishing"""
+    result['status'] = 'cut_short'
+    result['confidence'] = 0
+    result['note'] = note
+    return result
+
+def cut_short_result(username, platform_name, platform_info, note='Search deadline reached before this check started'):
+    """Result for a check that never ran because the search deadline passed"""
+    return mark_cut_short(new_result(username, platform_name, platform_info['url'].format(username)), note)
+
+def settle_budget(result, timeout, budget):
+    """A check that only timed out because its budget was clipped was cut short, not slow"""
+    if result['status'] == 'timeout' and budget < timeout:
+        mark_cut_short(result, 'Search deadline reached during this check')
+    return result
+
+def build_request_headers():
+    """Build browser-like request headers with a rotated user agent"""
     # Rotate user agents to avoid blocking
-    headers = {
+    return {
         'User-Agent': generate_user_agent(),
         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
         'Accept-Language': 'en-US,en;q=0.5',
@@ -206,109 +592,645 @@ def verify_profile(username, platform_name, platform_info, timeout=10):
         'Connection': 'keep-alive',
         'Upgrade-Insecure-Requests': '1',
     }
+
+def classify_status(result, status_code, platform_name, username):
+    """Classify a response by HTTP status, returning True if no body scan is needed"""
+    logger.info(f"{platform_name}/{username}: HTTP {status_code}")
     
-    start_time = time.time()
+    # Handle different status codes
+    if status_code == 404:
+        result['status'] = 'not_found'
+        result['confidence'] = 95
+        result['note'] = 'HTTP 404 - Profile does not exist'
+        return True
+    
+    elif status_code == 304:
+        result['status'] = 'not_modified'
+        result['confidence'] = 0
+        result['note'] = 'HTTP 304 - Page unchanged since the last check'
+        return True
+    
+    elif status_code == 403:
+        result['status'] = 'blocked'
+        result['confidence'] = 50
+        result['note'] = 'HTTP 403 - Access forbidden (may exist but blocked)'
+        return True
+    
+    elif status_code == 429:
+        result['status'] = 'rate_limited'
+        result['confidence'] = 0
+        result['note'] = 'HTTP 429 - Rate limited, try again later'
+        return True
+    
+    elif status_code >= 500:
+        result['status'] = 'error'
+        result['confidence'] = 0
+        result['note'] = f'HTTP {status_code} - Server error'
+        return True
+    
+    elif status_code != 200:
+        result['status'] = 'error'
+        result['confidence'] = 0
+        result['note'] = f'HTTP {status_code} - Unexpected response'
+        return True
+    
+    return False
+
+def conditional_headers(headers, validators):
+    """Add If-None-Match / If-Modified-Since from a previous check's validators"""
+    if validators:
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
+    return headers
+
+def note_validators(result, headers, validators):
+    """Keep a response's ETag and Last-Modified on the result when the caller asked for them"""
+    if validators is not None:
+        result['etag'] = headers.get('ETag')
+        result['last_modified'] = headers.get('Last-Modified')
+
+def probe_request_headers(headers, probe):
+    """Request headers for the first GET, asking only for the page head on range-probed platforms"""
+    if probe == 'range':
+        return dict(headers, Range=f'bytes=0-{PROBE_RANGE_BYTES - 1}')
+    return headers
+
+def classify_head_probe(result, status_code, platform_name, username):
+    """Settle a check from a HEAD probe's status alone, returning False if a full GET is needed"""
+    logger.info(f"{platform_name}/{username}: HEAD probe HTTP {status_code}")
+    
+    if status_code in (304, 404, 429):
+        classify_status(result, status_code, platform_name, username)
+        result['note'] += ' (HEAD probe)'
+    elif status_code == 200:
+        result['status'] = 'found'
+        result['confidence'] = 80
+        result['note'] = 'HTTP 200 (HEAD probe) - Profile exists'
+    else:
+        PROBES_TOTAL.inc(probe='head', outcome='fallback')
+        return False
+    
+    PROBES_TOTAL.inc(probe='head', outcome='settled')
+    return True
+
+def classify_range_probe(result, scan, platform_name, username):
+    """Settle a check from the first bytes of a page, returning False if the full page is needed"""
+    if scan.not_found_signature is None:
+        PROBES_TOTAL.inc(probe='range', outcome='fallback')
+        return False
+    
+    classify_body(result, scan, platform_name, username)
+    result['note'] += ' (range probe)'
+    PROBES_TOTAL.inc(probe='range', outcome='settled')
+    return True
+
+def classify_body(result, scan, platform_name, username):
+    """Classify a loaded profile page from its signature scan"""
+    # Check for "not found" signatures
+    if scan.not_found_signature is not None:
+        result['status'] = 'not_found'
+        result['confidence'] = 90
+        result['note'] = f'Found "not found" signature: {scan.not_found_signature}'
+        logger.info(f"{platform_name}/{username}: Not found via signature")
+        return result
+    
+    # Check for "exists" signatures
+    found_signatures = scan.found_signatures
+    exists_count = len(found_signatures)
+    
+    if exists_count > 0:
+        result['status'] = 'found'
+        result['confidence'] = min(70 + (exists_count * 10), 95)
+        result['note'] = f'Found {exists_count} existence indicators: {", ".join(found_signatures[:3])}'
+        logger.info(f"{platform_name}/{username}: Found via {exists_count} signatures")
+        return result
     
+    # If we get here, page loaded but no clear indicators
+    result['status'] = 'likely_exists'
+    result['confidence'] = 60
+    result['note'] = 'Page loaded successfully, likely exists'
+    logger.info(f"{platform_name}/{username}: Likely exists (page loaded)")
+    return result
+
+def parse_retry_after(value):
+    """Parse a Retry-After header (seconds or HTTP date) into seconds, or None"""
+    if not value:
+        return None
     try:
-        # Add random delay to be respectful to servers
-        time.sleep(random.uniform(0.5, 1.5))
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+        return max(retry_at.timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+class RateScheduler:
+    """Per-platform token buckets that decide when each check may be dispatched.
+    
+    reserve() takes a token and returns how long the caller should wait before
+    sending; it never sleeps itself, so waiting checks do not hold a worker.
+    Checks dropped before sending give their token back with release().
+    Buckets refill at 'rate' tokens per second up to 'burst', configurable per
+    catalog entry via a 'rate_limit' dict. A 429 pauses the platform for the
+    Retry-After period, or an exponential backoff when the header is missing.
+    """
+    
+    def __init__(self, default_rate=RATE_LIMIT_DEFAULT_RATE, default_burst=RATE_LIMIT_DEFAULT_BURST):
+        self.default_rate = default_rate
+        self.default_burst = default_burst
+        self._lock = threading.Lock()
+        self._buckets = {}  # platform -> {'rate', 'burst', 'tokens', 'updated', 'blocked_until', 'backoffs', 'rate_limited', 'source'}
+    
+    def _limits(self, platform_info):
+        limits = (platform_info or {}).get('rate_limit', {})
+        return float(limits.get('rate', self.default_rate)), float(limits.get('burst', self.default_burst))
+    
+    def _bucket(self, platform_name, platform_info, now):
+        bucket = self._buckets.get(platform_name)
+        if bucket is None:
+            rate, burst = self._limits(platform_info)
+            bucket = {'rate': rate, 'burst': burst, 'tokens': burst, 'updated': now,
+                      'blocked_until': 0.0, 'backoffs': 0, 'rate_limited': 0, 'source': platform_info}
+            self._buckets[platform_name] = bucket
+        elif platform_info is not None and bucket['source'] is not platform_info:
+            # The catalog entry was replaced by a reload: apply its limits, keeping the balance and any backoff
+            bucket['rate'], bucket['burst'] = self._limits(platform_info)
+            bucket['tokens'] = min(bucket['tokens'], bucket['burst'])
+            bucket['source'] = platform_info
+        return bucket
+    
+    def _refill(self, platform_name, platform_info, now):
+        bucket = self._bucket(platform_name, platform_info, now)
+        bucket['tokens'] = min(bucket['burst'], bucket['tokens'] + (now - bucket['updated']) * bucket['rate'])
+        bucket['updated'] = now
+        return bucket
+    
+    def reserve(self, platform_name, platform_info=None):
+        """Reserve a request slot and return the delay in seconds before it may be sent"""
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._refill(platform_name, platform_info, now)
+            bucket['tokens'] -= 1
+            
+            # A negative balance means this slot is queued behind earlier reservations
+            delay = -bucket['tokens'] / bucket['rate'] if bucket['tokens'] < 0 else 0.0
+            return max(delay, bucket['blocked_until'] - now)
+    
+    def release(self, platform_name):
+        """Hand back a reserved token for a check cancelled before it was sent"""
+        with self._lock:
+            bucket = self._buckets.get(platform_name)
+            if bucket is not None:
+                bucket['tokens'] = min(bucket['burst'], bucket['tokens'] + 1)
+    
+    def try_reserve(self, platform_name, platform_info=None):
+        """Take a token only if one is free right now, for optional extra requests such as hedges"""
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._refill(platform_name, platform_info, now)
+            if bucket['tokens'] < 1 or bucket['blocked_until'] > now:
+                return False
+            bucket['tokens'] -= 1
+            return True
+    
+    def backoff_remaining(self, platform_name):
+        """Seconds left on a platform's 429 backoff, checked again right before sending"""
+        with self._lock:
+            bucket = self._buckets.get(platform_name)
+            if bucket is None:
+                return 0.0
+            return max(bucket['blocked_until'] - time.monotonic(), 0.0)
+    
+    def record_rate_limited(self, platform_name, retry_after=None):
+        """Pause a platform after an HTTP 429"""
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._bucket(platform_name, None, now)
+            bucket['rate_limited'] += 1
+            if bucket['blocked_until'] > now:
+                # Already backing off; late 429s from requests sent before the pause don't escalate it
+                return
+            bucket['backoffs'] += 1
+            delay = parse_retry_after(retry_after)
+            if delay is None:
+                delay = RATE_LIMIT_BACKOFF_BASE * (2 ** (bucket['backoffs'] - 1))
+            delay = min(delay, RATE_LIMIT_BACKOFF_MAX)
+            bucket['blocked_until'] = max(bucket['blocked_until'], now + delay)
+        logger.warning(f"{platform_name}: Rate limited, backing off for {delay:.1f}s")
+    
+    def record_success(self, platform_name):
+        """Reset the exponential backoff once a platform answers normally again"""
+        with self._lock:
+            bucket = self._buckets.get(platform_name)
+            if bucket is not None:
+                bucket['backoffs'] = 0
+    
+    def stats(self):
+        """Current bucket state per platform"""
+        now = time.monotonic()
+        with self._lock:
+            return {
+                platform_name: {
+                    'rate': bucket['rate'],
+                    'burst': bucket['burst'],
+                    'tokens': round(min(bucket['burst'], bucket['tokens'] + (now - bucket['updated']) * bucket['rate']), 2),
+                    'backoff_seconds': round(max(bucket['blocked_until'] - now, 0.0), 1),
+                    'rate_limited': bucket['rate_limited']
+                }
+                for platform_name, bucket in self._buckets.items()
+            }
+
+rate_scheduler = RateScheduler()
+
+class LatencyTracker:
+    """Rolling per-platform response times used to size each check's timeout.
+    
+    Keeps the last LATENCY_WINDOW answered response times per platform and
+    whether each recent check timed out. Timed-out checks never enter the
+    percentile: their duration is the timeout itself, and counting it would
+    let a single stall hold the timeout up. Once a platform has
+    LATENCY_MIN_SAMPLES samples its timeout is TIMEOUT_P95_MULTIPLIER x p95,
+    clamped to [TIMEOUT_MIN, TIMEOUT_MAX]; until then, or while more than
+    LATENCY_MAX_TIMEOUT_RATE of recent checks time out, CHECK_TIMEOUT applies.
+    """
+    
+    def __init__(self, window=LATENCY_WINDOW):
+        self.window = window
+        self._lock = threading.Lock()
+        self._platforms = {}  # platform -> {'samples': deque, 'timed_out': deque of 0/1, 'p95': seconds or None}
+    
+    def record(self, platform_name, seconds, timed_out=False):
+        """Add one check's response time, or note that it timed out"""
+        with self._lock:
+            stats = self._platforms.get(platform_name)
+            if stats is None:
+                stats = {'samples': deque(maxlen=self.window), 'timed_out': deque(maxlen=self.window), 'p95': None}
+                self._platforms[platform_name] = stats
+            stats['timed_out'].append(int(timed_out))
+            if not timed_out:
+                stats['samples'].append(seconds)
+                stats['p95'] = None  # Recomputed on next use
+    
+    def _p95(self, stats):
+        if stats['p95'] is None:
+            # Nearest-rank percentile, so it is never simply the slowest sample
+            ordered = sorted(stats['samples'])
+            stats['p95'] = ordered[max(math.ceil(len(ordered) * 0.95) - 1, 0)]
+        return stats['p95']
+    
+    def _timeout_rate(self, stats):
+        return sum(stats['timed_out']) / len(stats['timed_out']) if stats['timed_out'] else 0.0
+    
+    def p95(self, platform_name):
+        """Recent p95 response time in seconds, or None while there are too few samples"""
+        with self._lock:
+            stats = self._platforms.get(platform_name)
+            if stats is None or len(stats['samples']) < LATENCY_MIN_SAMPLES:
+                return None
+            return self._p95(stats)
+    
+    def timeout_for(self, platform_name, default=CHECK_TIMEOUT):
+        """Timeout for the next check on a platform"""
+        if not ADAPTIVE_TIMEOUTS:
+            return default
+        with self._lock:
+            stats = self._platforms.get(platform_name)
+            if stats is None or len(stats['samples']) < LATENCY_MIN_SAMPLES:
+                return default
+            if self._timeout_rate(stats) > LATENCY_MAX_TIMEOUT_RATE:
+                return default
+            p95 = self._p95(stats)
+        return min(max(p95 * TIMEOUT_P95_MULTIPLIER, TIMEOUT_MIN), TIMEOUT_MAX)
+    
+    def stats(self):
+        """Sample count, p95, timeout rate and current timeout per platform"""
+        with self._lock:
+            platforms = {name: (len(stats['samples']), self._timeout_rate(stats)) for name, stats in self._platforms.items()}
+        return {
+            name: {
+                'samples': samples,
+                'p95_ms': int(self.p95(name) * 1000) if samples >= LATENCY_MIN_SAMPLES else None,
+                'timeout_rate': round(timeout_rate, 3),
+                'timeout': round(self.timeout_for(name), 2)
+            }
+            for name, (samples, timeout_rate) in platforms.items()
+        }
+
+latency_tracker = LatencyTracker()
+
+class CircuitBreaker:
+    """Per-platform circuit breakers that skip platforms which keep failing.
+    
+    A breaker opens after BREAKER_FAILURE_THRESHOLD consecutive blocked,
+    error or timeout results, and while it is open checks for the platform
+    come back at once as skipped_unavailable. After BREAKER_COOLDOWN it goes
+    half-open and lets a single trial check through: an answer closes it,
+    another failure reopens it for a fresh cool-down. Rate limiting and
+    deadline cut-offs are left to the rate scheduler and don't count.
+    """
+    
+    STATE_VALUES = {'closed': 0, 'half_open': 1, 'open': 2}
+    
+    def __init__(self, threshold=BREAKER_FAILURE_THRESHOLD, cooldown=BREAKER_COOLDOWN):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._lock = threading.Lock()
+        self._breakers = {}  # platform -> {'state', 'failures', 'opened_at', 'trial_started', 'opens', 'skipped'}
+    
+    def _breaker(self, platform_name):
+        breaker = self._breakers.get(platform_name)
+        if breaker is None:
+            breaker = {'state': 'closed', 'failures': 0, 'opened_at': 0.0, 'trial_started': None, 'opens': 0, 'skipped': 0}
+            self._breakers[platform_name] = breaker
+        return breaker
+    
+    def _set_state(self, platform_name, breaker, state):
+        breaker['state'] = state
+        BREAKER_STATE.set(self.STATE_VALUES[state], platform=platform_name)
+    
+    def allow(self, platform_name):
+        """Whether a check may be sent now; takes the single trial slot when half-open"""
+        if not CIRCUIT_BREAKER:
+            return True
+        now = time.monotonic()
+        with self._lock:
+            breaker = self._breakers.get(platform_name)
+            if breaker is None or breaker['state'] == 'closed':
+                return True
+            if breaker['state'] == 'open' and now - breaker['opened_at'] >= self.cooldown:
+                self._set_state(platform_name, breaker, 'half_open')
+                breaker['trial_started'] = None
+            # A trial that never reported back (e.g. it was cancelled) is replaced after a cool-down
+            if breaker['state'] == 'half_open' and (breaker['trial_started'] is None or now - breaker['trial_started'] >= self.cooldown):
+                breaker['trial_started'] = now
+                return True
+            breaker['skipped'] += 1
+            return False
+    
+    def retry_in(self, platform_name):
+        """Seconds until a platform's breaker lets a trial check through"""
+        with self._lock:
+            breaker = self._breakers.get(platform_name)
+            if breaker is None or breaker['state'] == 'closed':
+                return 0.0
+            started = breaker['opened_at'] if breaker['state'] == 'open' else (breaker['trial_started'] or 0.0)
+            return max(started + self.cooldown - time.monotonic(), 0.0)
+    
+    def record(self, platform_name, status):
+        """Feed a fresh check's status into its platform's breaker"""
+        if status not in BREAKER_FAILURE_STATUSES and (status in UNANSWERED_STATUSES or status == 'rate_limited'):
+            return
+        with self._lock:
+            breaker = self._breaker(platform_name)
+            if status not in BREAKER_FAILURE_STATUSES:
+                breaker['failures'] = 0
+                if breaker['state'] == 'closed':
+                    return
+                self._set_state(platform_name, breaker, 'closed')
+                opened = False
+            else:
+                breaker['failures'] += 1
+                if breaker['state'] == 'open' or (breaker['state'] == 'closed' and breaker['failures'] < self.threshold):
+                    return
+                self._set_state(platform_name, breaker, 'open')
+                breaker['opened_at'] = time.monotonic()
+                breaker['opens'] += 1
+                opened = True
         
+        if opened:
+            logger.warning(f"{platform_name}: Circuit breaker open after {status}, skipping checks for {self.cooldown:.0f}s")
+        else:
+            logger.info(f"{platform_name}: Circuit breaker closed, platform is answering again")
+    
+    def stats(self):
+        """Breaker state per platform that has reported results"""
+        with self._lock:
+            platforms = {name: dict(breaker) for name, breaker in self._breakers.items()}
+        return {
+            name: {
+                'state': breaker['state'],
+                'consecutive_failures': breaker['failures'],
+                'opens': breaker['opens'],
+                'skipped': breaker['skipped'],
+                'retry_in': round(self.retry_in(name), 1)
+            }
+            for name, breaker in platforms.items()
+        }
+
+circuit_breaker = CircuitBreaker()
+
+def record_rate_outcome(platform_name, status_code, headers):
+    """Feed a response status back into the platform's rate scheduler"""
+    if status_code == 429:
+        rate_scheduler.record_rate_limited(platform_name, headers.get('Retry-After'))
+    else:
+        rate_scheduler.record_success(platform_name)
+
+def host_key(url):
+    """Return the host a platform URL connects to, used to key pools and limits"""
+    return urlparse(url).netloc.lower()
+
+class HostSessionPool:
+    """Thread-safe keep-alive requests.Session per platform host.
+    
+    Each host gets its own Session with an HTTPAdapter sized to
+    POOL_CONNECTIONS_PER_HOST, so repeat checks against the same site reuse
+    TCP/TLS connections instead of handshaking again. The adapter keeps
+    pools for up to POOL_HOSTS_PER_SESSION hosts, so a site that redirects
+    to another host keeps both connections alive. Sessions idle for longer
+    than idle_timeout are closed the next time the pool is touched.
+    """
+    
+    def __init__(self, pool_size=POOL_CONNECTIONS_PER_HOST, idle_timeout=POOL_IDLE_TIMEOUT):
+        self.pool_size = pool_size
+        self.idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        self._sessions = {}  # host -> {'session', 'last_used', 'in_use'}
+        self._counters = {'sessions_created': 0, 'sessions_evicted': 0, 'checkouts': 0}
+    
+    def _new_session(self):
+        session = requests.Session()
+        # Don't carry cookies from one check (or one analyst's search) into later ones
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        adapter = HTTPAdapter(pool_connections=POOL_HOSTS_PER_SESSION, pool_maxsize=self.pool_size)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+    
+    def _evict_idle(self, now):
+        for host, entry in list(self._sessions.items()):
+            if entry['in_use'] == 0 and now - entry['last_used'] > self.idle_timeout:
+                entry['session'].close()
+                del self._sessions[host]
+                self._counters['sessions_evicted'] += 1
+    
+    @contextmanager
+    def session_for(self, url):
+        """Check out the shared session for the URL's host"""
+        host = host_key(url)
+        now = time.monotonic()
+        with self._lock:
+            self._evict_idle(now)
+            entry = self._sessions.get(host)
+            if entry is None:
+                entry = {'session': self._new_session(), 'last_used': now, 'in_use': 0}
+                self._sessions[host] = entry
+                self._counters['sessions_created'] += 1
+            entry['in_use'] += 1
+            entry['last_used'] = now
+            self._counters['checkouts'] += 1
+        try:
+            yield entry['session']
+        finally:
+            with self._lock:
+                entry['in_use'] -= 1
+                entry['last_used'] = time.monotonic()
+    
+    def stats(self):
+        """Pool usage statistics per host"""
+        with self._lock:
+            hosts = {}
+            for host, entry in self._sessions.items():
+                requests_sent = connections_opened = 0
+                for adapter in {id(a): a for a in entry['session'].adapters.values()}.values():
+                    for key in adapter.poolmanager.pools.keys():
+                        pool = adapter.poolmanager.pools.get(key)
+                        if pool is not None:
+                            requests_sent += pool.num_requests
+                            connections_opened += pool.num_connections
+                hosts[host] = {
+                    'in_use': entry['in_use'],
+                    'idle_seconds': round(time.monotonic() - entry['last_used'], 1),
+                    'requests': requests_sent,
+                    'connections_opened': connections_opened
+                }
+            return dict(self._counters, active_sessions=len(self._sessions), pool_size=self.pool_size, hosts=hosts)
+
+session_pool = HostSessionPool()
+
+def time_left(stop_at):
+    """Seconds left before stop_at (a time.monotonic() value), raising Timeout once it has passed"""
+    remaining = stop_at - time.monotonic()
+    if remaining <= 0:
+        raise requests.exceptions.Timeout('Check time budget exhausted')
+    return remaining
+
+def _shutdown_socket(sock):
+    try:
+        sock.shutdown(socket.SHUT_RDWR)
+    except OSError:
+        pass  # Already closed
+
+def scan_body(response, matcher, stop_at):
+    """Stream a page into a signature scan, giving up once stop_at (a time.monotonic() value) passes.
+    
+    requests' timeout only bounds each socket read, so a server trickling
+    bytes could hold the check far past its budget. A timer shuts the socket
+    down at stop_at to unblock the read, which surfaces as a Timeout.
+    """
+    scan = SignatureScan(matcher, response.encoding)
+    sock = getattr(getattr(response.raw, 'connection', None), 'sock', None)
+    timer = None
+    if sock is not None:
+        timer = threading.Timer(time_left(stop_at), _shutdown_socket, (sock,))
+        timer.daemon = True
+        timer.start()
+    try:
+        for chunk in response.iter_content(BODY_CHUNK_SIZE):
+            if scan.feed(chunk):
+                break
+            time_left(stop_at)
+        else:
+            scan.finish()
+    except (requests.exceptions.RequestException, OSError):
+        if time.monotonic() >= stop_at:
+            raise requests.exceptions.Timeout('Check time budget exhausted while reading the page') from None
+        raise
+    finally:
+        if timer is not None:
+            timer.cancel()
+    return scan
+
+def verify_profile(username, platform_name, platform_info, timeout=CHECK_TIMEOUT, validators=None, deadline=None):
+    """Verify if a profile exists on a platform.
+    
+    The whole check, body included, stops after timeout seconds or at
+    deadline (a time.monotonic() value), whichever comes first.
+    """
+    url = platform_info['url'].format(username)
+    result = new_result(username, platform_name, url)
+    headers = conditional_headers(build_request_headers(), validators)
+    
+    start_time = time.time()
+    stop_at = time.monotonic() + timeout
+    if deadline is not None:
+        stop_at = min(stop_at, deadline)
+    
+    try:
         logger.info(f"Checking {platform_name} for username: {username}")
         
-        response = requests.get(
-            url, 
-            headers=headers, 
-            timeout=timeout, 
-            allow_redirects=True,
-            verify=True
-        )
+        probe = platform_info.get('probe')
+        matcher = get_signature_matcher(platform_name, platform_info)
         
-        result['response_time'] = int((time.time() - start_time) * 1000)
-        status_code = response.status_code
-        
-        logger.info(f"{platform_name}/{username}: HTTP {status_code}")
-        
-        # Handle different status codes
-        if status_code == 404:
-            result['status'] = 'not_found'
-            result['confidence'] = 95
-            result['note'] = 'HTTP 404 - Profile does not exist'
-            return result
-        
-        elif status_code == 403:
-            result['status'] = 'blocked'
-            result['confidence'] = 50
-            result['note'] = 'HTTP 403 - Access forbidden (may exist but blocked)'
-            return result
-        
-        elif status_code == 429:
-            result['status'] = 'rate_limited'
-            result['confidence'] = 0
-            result['note'] = 'HTTP 429 - Rate limited, try again later'
-            return result
-        
-        elif status_code >= 500:
-            result['status'] = 'error'
-            result['confidence'] = 0
-            result['note'] = f'HTTP {status_code} - Server error'
-            return result
-        
-        elif status_code != 200:
-            result['status'] = 'error'
-            result['confidence'] = 0
-            result['note'] = f'HTTP {status_code} - Unexpected response'
-            return result
-        
-        # Analyze page content for better accuracy
-        try:
-            content = response.text.lower()
-            
-            # Check for "not found" signatures
-            not_found_signatures = platform_info.get('not_found_signatures', [])
-            for signature in not_found_signatures:
-                if signature.lower() in content:
-                    result['status'] = 'not_found'
-                    result['confidence'] = 90
-                    result['note'] = f'Found "not found" signature: {signature}'
-                    logger.info(f"{platform_name}/{username}: Not found via signature")
+        with session_pool.session_for(url) as session:
+            # Cheap status-only probe first for platforms whose HEAD status is reliable
+            if probe == 'head':
+                head_response = session.head(url, headers=headers, timeout=time_left(stop_at), allow_redirects=True, verify=True)
+                record_rate_outcome(platform_name, head_response.status_code, head_response.headers)
+                note_validators(result, head_response.headers, validators)
+                if classify_head_probe(result, head_response.status_code, platform_name, username):
+                    observe_phases({'first_byte': head_response.elapsed.total_seconds()})
+                    result['response_time'] = int((time.time() - start_time) * 1000)
                     return result
             
-            # Check for "exists" signatures
-            exists_signatures = platform_info.get('exists_signatures', [])
-            exists_count = 0
-            found_signatures = []
-            
-            for signature in exists_signatures:
-                if signature.lower() in content:
-                    exists_count += 1
-                    found_signatures.append(signature)
-            
-            if exists_count > 0:
-                result['status'] = 'found'
-                result['confidence'] = min(70 + (exists_count * 10), 95)
-                result['note'] = f'Found {exists_count} existence indicators: {", ".join(found_signatures[:3])}'
-                logger.info(f"{platform_name}/{username}: Found via {exists_count} signatures")
-                return result
-            
-            # If we get here, page loaded but no clear indicators
-            result['status'] = 'likely_exists'
-            result['confidence'] = 60
-            result['note'] = 'Page loaded successfully, likely exists'
-            logger.info(f"{platform_name}/{username}: Likely exists (page loaded)")
+            response = session.get(
+                url, 
+                headers=probe_request_headers(headers, probe), 
+                timeout=time_left(stop_at), 
+                allow_redirects=True,
+                verify=True,
+                stream=True
+            )
             
-        except Exception as e:
-            result['status'] = 'found'  # If we can't parse, assume it exists since we got 200
-            result['confidence'] = 70
-            result['note'] = f'Page loaded (parsing error: {str(e)[:50]})'
-            logger.warning(f"{platform_name}/{username}: Parsing error: {e}")
+            # A honoured Range request only settles not-found pages; anything else needs the full page
+            if response.status_code == 206:
+                with response:
+                    record_rate_outcome(platform_name, response.status_code, response.headers)
+                    note_validators(result, response.headers, validators)
+                    scan = scan_body(response, matcher, stop_at)
+                if classify_range_probe(result, scan, platform_name, username):
+                    observe_phases({'first_byte': response.elapsed.total_seconds(), 'match': scan.match_seconds})
+                    result['response_time'] = int((time.time() - start_time) * 1000)
+                    return result
+                response = session.get(url, headers=headers, timeout=time_left(stop_at), allow_redirects=True, verify=True, stream=True)
         
+        # requests only exposes time-to-headers, which includes connect and TLS
+        timings = {'first_byte': response.elapsed.total_seconds()}
+        body_started = time.perf_counter()
+        
+        # Only download as much of the page as the signature scan needs
+        with response:
+            record_rate_outcome(platform_name, response.status_code, response.headers)
+            note_validators(result, response.headers, validators)
+            if not classify_status(result, response.status_code, platform_name, username):
+                scan = scan_body(response, matcher, stop_at)
+                classify_body(result, scan, platform_name, username)
+                timings['match'] = scan.match_seconds
+                timings['body'] = time.perf_counter() - body_started - scan.match_seconds
+        
+        observe_phases(timings)
+        result['response_time'] = int((time.time() - start_time) * 1000)
         return result
         
     except requests.exceptions.Timeout:
         result['status'] = 'timeout'
         result['confidence'] = 0
         result['note'] = 'Request timed out'
-        result['response_time'] = timeout * 1000
+        result['response_time'] = int(timeout * 1000)
         logger.warning(f"{platform_name}/{username}: Timeout")
         
     except requests.exceptions.ConnectionError:
@@ -331,91 +1253,1958 @@ def verify_profile(username, platform_name, platform_info, timeout=10):
     
     return result
 
-@app.route('/api/search', methods=['POST'])
-def search_username():
-    """Main API endpoint for username search"""
+async def verify_profile_async(session, username, platform_name, platform_info, timeout=CHECK_TIMEOUT, validators=None):
+    """Verify if a profile exists on a platform using a shared aiohttp session.
+    
+    Probes and the full GET share one budget of timeout seconds.
+    """
+    url = platform_info['url'].format(username)
+    result = new_result(username, platform_name, url)
+    headers = conditional_headers(build_request_headers(), validators)
+    
+    start_time = time.time()
+    stop_at = time.monotonic() + timeout
+    
+    def client_timeout():
+        # Each request gets only what is left of the check's budget
+        remaining = stop_at - time.monotonic()
+        if remaining <= 0:
+            raise asyncio.TimeoutError()
+        return aiohttp.ClientTimeout(total=remaining)
+    
     try:
-        data = request.get_json()
-        username = data.get('username', '').strip()
-        include_variations = data.get('includeVariations', False)
+        logger.info(f"Checking {platform_name} for username: {username}")
         
-        if not username:
-            return jsonify({'error': 'Username is required'}), 400
+        probe = platform_info.get('probe')
+        matcher = get_signature_matcher(platform_name, platform_info)
         
-        logger.info(f"Starting search for username: {username}")
+        # Cheap status-only probe first for platforms whose HEAD status is reliable
+        if probe == 'head':
+            trace = {}
+            async with session.head(url, headers=headers, timeout=client_timeout(), allow_redirects=True,
+                                    trace_request_ctx=trace) as head_response:
+                record_rate_outcome(platform_name, head_response.status, head_response.headers)
+                note_validators(result, head_response.headers, validators)
+                if classify_head_probe(result, head_response.status, platform_name, username):
+                    observe_phases({'dns': trace.get('dns', 0.0), 'connect': trace.get('connect', 0.0)})
+                    result['response_time'] = int((time.time() - start_time) * 1000)
+                    return result
         
-        # Generate variations if requested
-        usernames_to_check = [username]
-        if include_variations:
-            usernames_to_check = generate_variations(username)
-            logger.info(f"Generated {len(usernames_to_check)} variations")
+        trace = {}  # Filled in by the engine's trace hooks
+        response = await session.get(
+            url,
+            headers=probe_request_headers(headers, probe),
+            timeout=client_timeout(),
+            allow_redirects=True,
+            trace_request_ctx=trace
+        )
         
-        all_results = []
+        # A honoured Range request only settles not-found pages; anything else needs the full page
+        if response.status == 206:
+            async with response:
+                record_rate_outcome(platform_name, response.status, response.headers)
+                note_validators(result, response.headers, validators)
+                scan = SignatureScan(matcher, response.charset)
+                async for chunk in response.content.iter_chunked(BODY_CHUNK_SIZE):
+                    if scan.feed(chunk):
+                        break
+                else:
+                    scan.finish()
+            if classify_range_probe(result, scan, platform_name, username):
+                observe_phases({'dns': trace.get('dns', 0.0), 'connect': trace.get('connect', 0.0), 'match': scan.match_seconds})
+                result['response_time'] = int((time.time() - start_time) * 1000)
+                return result
+            trace = {}
+            response = await session.get(url, headers=headers, timeout=client_timeout(), allow_redirects=True,
+                                         trace_request_ctx=trace)
         
-        # Use ThreadPoolExecutor for concurrent requests
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            future_to_info = {}
-            
-            # Submit all verification tasks
-            for category, platforms in PLATFORMS.items():
-                for platform_name, platform_info in platforms.items():
-                    for username_variant in usernames_to_check:
-                        future = executor.submit(verify_profile, username_variant, platform_name, platform_info)
-                        future_to_info[future] = {
-                            'category': category,
-                            'platform': platform_name,
-                            'username': username_variant
-                        }
+        async with response:
+            body_started = time.perf_counter()
+            timings = {'dns': trace.get('dns', 0.0), 'connect': trace.get('connect', 0.0)}
+            timings['first_byte'] = body_started - trace.get('request_start', body_started) - timings['dns'] - timings['connect']
             
-            # Collect results as they complete
-            for future in as_completed(future_to_info):
-                try:
-                    result = future.result()
-                    result['category'] = future_to_info[future]['category']
-                    all_results.append(result)
-                except Exception as e:
-                    # Handle individual task failures
-                    info = future_to_info[future]
-                    error_result = {
-                        'platform': info['platform'],
-                        'category': info['category'],
-                        'username': info['username'],
-                        'url': '',
-                        'status': 'error',
-                        'response_time': 0,
-                        'confidence': 0,
-                        'note': f'Task failed: {str(e)[:50]}'
-                    }
-                    all_results.append(error_result)
-                    logger.error(f"Task failed for {info['platform']}/{info['username']}: {e}")
-        
-        # Filter and organize results - only show high confidence results
-        verified_results = [r for r in all_results if r['status'] in ['found', 'likely_exists'] and r['confidence'] >= 60]
-        
-        # Calculate statistics
-        total_found = len(verified_results)
-        platforms_checked = len(set(r['platform'] for r in all_results))
-        response_times = [r['response_time'] for r in all_results if r['response_time'] > 0]
-        avg_response_time = int(sum(response_times) / max(len(response_times), 1))
-        
-        logger.info(f"Search complete: {total_found} verified profiles found across {platforms_checked} platforms")
+            # Only download as much of the page as the signature scan needs
+            record_rate_outcome(platform_name, response.status, response.headers)
+            note_validators(result, response.headers, validators)
+            if not classify_status(result, response.status, platform_name, username):
+                scan = SignatureScan(matcher, response.charset)
+                async for chunk in response.content.iter_chunked(BODY_CHUNK_SIZE):
+                    if scan.feed(chunk):
+                        break
+                else:
+                    scan.finish()
+                classify_body(result, scan, platform_name, username)
+                timings['match'] = scan.match_seconds
+                timings['body'] = time.perf_counter() - body_started - scan.match_seconds
         
-        return jsonify({
-            'username': username,
-            'total_found': total_found,
-            'platforms_checked': platforms_checked,
-            'avg_response_time': avg_response_time,
-            'results': verified_results,
-            'debug_info': {
-                'total_checks': len(all_results),
-                'variations_used': len(usernames_to_check),
-                'include_variations': include_variations
-            }
-        })
+        observe_phases(timings)
+        result['response_time'] = int((time.time() - start_time) * 1000)
+        return result
+    
+    except asyncio.TimeoutError:
+        result['status'] = 'timeout'
+        result['confidence'] = 0
+        result['note'] = 'Request timed out'
+        result['response_time'] = int(timeout * 1000)
+        logger.warning(f"{platform_name}/{username}: Timeout")
+    
+    except aiohttp.ClientConnectionError:
+        result['status'] = 'connection_error'
+        result['confidence'] = 0
+        result['note'] = 'Connection failed'
+        logger.warning(f"{platform_name}/{username}: Connection error")
+    
+    except aiohttp.ClientError as e:
+        result['status'] = 'error'
+        result['confidence'] = 0
+        result['note'] = f'Request error: {str(e)[:50]}'
+        logger.warning(f"{platform_name}/{username}: Request error: {e}")
     
     except Exception as e:
-        logger.error(f"Search endpoint error: {e}")
-        return jsonify({'error': f'Internal server error: {str(e)}'}), 500
+        result['status'] = 'error'
+        result['confidence'] = 0
+        result['note'] = f'Unexpected error: {str(e)[:50]}'
+        logger.error(f"{platform_name}/{username}: Unexpected error: {e}")
+    
+    return result
+
+class AsyncVerificationEngine:
+    """Runs verify_profile_async checks on one long-lived background event loop.
+    
+    Checks from every search in this worker share the loop and the aiohttp
+    session, and a global semaphore caps how many are in flight at once.
+    The session's connector keeps up to POOL_CONNECTIONS_PER_HOST keep-alive
+    connections per host and drops them after POOL_IDLE_TIMEOUT seconds idle.
+    submit() returns a concurrent.futures.Future, so callers can keep using
+    as_completed exactly like with the thread pool.
+    """
+    
+    def __init__(self, max_concurrency=MAX_CONCURRENCY):
+        self.max_concurrency = max_concurrency
+        self._lock = threading.Lock()
+        self._loop = None
+        self._thread = None
+        self._session = None
+        self._semaphore = None
+        self._host_stats = defaultdict(lambda: {'requests': 0, 'connections_opened': 0, 'connections_reused': 0})
+        self.in_flight = 0
+    
+    def _ensure_loop(self):
+        # Started lazily so gunicorn workers each get their own loop after fork
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                loop = asyncio.new_event_loop()
+                self._semaphore = asyncio.Semaphore(self.max_concurrency)
+                self._session = None
+                self._thread = threading.Thread(target=loop.run_forever, name='osint-async-engine', daemon=True)
+                self._loop = loop
+                self._thread.start()
+            return self._loop
+    
+    def _trace_config(self):
+        # Per-host request and connection counters for pool statistics, plus
+        # phase timings written into the dict passed as trace_request_ctx.
+        # aiohttp does not report the TLS handshake separately from connect.
+        def timing(ctx):
+            return ctx.trace_request_ctx if isinstance(ctx.trace_request_ctx, dict) else {}
+        
+        async def on_request_start(session, ctx, params):
+            ctx.host = params.url.host
+            self._host_stats[ctx.host]['requests'] += 1
+            timing(ctx).setdefault('request_start', time.perf_counter())
+        
+        async def on_dns_resolvehost_start(session, ctx, params):
+            ctx.dns_start = time.perf_counter()
+        
+        async def on_dns_resolvehost_end(session, ctx, params):
+            trace = timing(ctx)
+            trace['dns'] = trace.get('dns', 0.0) + time.perf_counter() - ctx.dns_start
+        
+        async def on_connection_create_start(session, ctx, params):
+            ctx.connect_start = time.perf_counter()
+            ctx.dns_before_connect = timing(ctx).get('dns', 0.0)
+        
+        async def on_connection_create_end(session, ctx, params):
+            self._host_stats[ctx.host]['connections_opened'] += 1
+            trace = timing(ctx)
+            dns_during_connect = trace.get('dns', 0.0) - ctx.dns_before_connect
+            trace['connect'] = trace.get('connect', 0.0) + time.perf_counter() - ctx.connect_start - dns_during_connect
+        
+        async def on_connection_reuseconn(session, ctx, params):
+            self._host_stats[ctx.host]['connections_reused'] += 1
+        
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_dns_resolvehost_start.append(on_dns_resolvehost_start)
+        trace_config.on_dns_resolvehost_end.append(on_dns_resolvehost_end)
+        trace_config.on_connection_create_start.append(on_connection_create_start)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        return trace_config
+    
+    async def _get_session(self):
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_concurrency,
+                limit_per_host=POOL_CONNECTIONS_PER_HOST,
+                keepalive_timeout=POOL_IDLE_TIMEOUT,
+                ttl_dns_cache=300
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                cookie_jar=aiohttp.DummyCookieJar(),  # Checks must not share cookies
+                trace_configs=[self._trace_config()]
+            )
+        return self._session
+    
+    async def _hedged(self, check, platform_name, platform_info):
+        # Race a second copy of a check that outlives the platform's p95, if a
+        # rate limit token and a concurrency slot are free; first answer wins
+        primary = asyncio.ensure_future(check())
+        hedge = None
+        try:
+            hedge_after = latency_tracker.p95(platform_name)
+            if hedge_after is not None:
+                done, _ = await asyncio.wait({primary}, timeout=hedge_after)
+                if not done and not self._semaphore.locked() and rate_scheduler.try_reserve(platform_name, platform_info):
+                    await self._semaphore.acquire()
+                    hedge = asyncio.ensure_future(check())
+            if hedge is None:
+                return await primary
+            
+            pending = {primary, hedge}
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                answered = [task for task in done if task.result()['status'] not in UNANSWERED_STATUSES]
+                if answered or not pending:
+                    winner = (answered or list(done))[0]
+                    HEDGES_TOTAL.inc(platform=platform_name, outcome='won' if winner is hedge else 'lost')
+                    return dict(winner.result(), hedged=True)
+        finally:
+            primary.cancel()
+            if hedge is not None:
+                hedge.cancel()
+                self._semaphore.release()
+    
+    async def _run_check(self, username, platform_name, platform_info, timeout, deadline, validators):
+        CHECKS_WAITING.inc(engine='async')
+        try:
+            # Wait for the platform's rate limit before taking a concurrency slot
+            queued = time.perf_counter()
+            delay = rate_scheduler.reserve(platform_name, platform_info)
+            try:
+                while delay > 0:
+                    await asyncio.sleep(delay)
+                    delay = rate_scheduler.backoff_remaining(platform_name)
+                rate_waited = time.perf_counter()
+                await self._semaphore.acquire()
+            except asyncio.CancelledError:
+                rate_scheduler.release(platform_name)
+                raise
+        finally:
+            CHECKS_WAITING.dec(engine='async')
+        
+        observe_phases({'rate_limit_wait': rate_waited - queued, 'queue_wait': time.perf_counter() - rate_waited})
+        CHECKS_IN_FLIGHT.inc(engine='async')
+        self.in_flight += 1
+        try:
+            timeout = timeout or latency_tracker.timeout_for(platform_name)
+            budget = check_budget(timeout, deadline)
+            if budget <= 0:
+                rate_scheduler.release(platform_name)
+                return cut_short_result(username, platform_name, platform_info)
+            session = await self._get_session()
+            check = partial(verify_profile_async, session, username, platform_name, platform_info, budget, validators)
+            result = await (self._hedged(check, platform_name, platform_info) if HEDGE_REQUESTS else check())
+            return settle_budget(result, timeout, budget)
+        finally:
+            self.in_flight -= 1
+            CHECKS_IN_FLIGHT.dec(engine='async')
+            self._semaphore.release()
+    
+    def submit(self, username, platform_name, platform_info, timeout=None, deadline=None, validators=None):
+        """Schedule a check on the engine loop and return a concurrent future (timeout None = adaptive)"""
+        loop = self._ensure_loop()
+        return asyncio.run_coroutine_threadsafe(
+            self._run_check(username, platform_name, platform_info, timeout, deadline, validators), loop
+        )
+    
+    def shutdown(self):
+        """Close the shared session and stop the engine loop"""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                return
+            if self._session is not None:
+                asyncio.run_coroutine_threadsafe(self._session.close(), self._loop).result(timeout=5)
+                self._session = None
+            self._loop.call_soon_threadsafe(self._loop.stop)
+    
+    def stats(self):
+        """Connection usage statistics per host"""
+        return {
+            'pool_size': POOL_CONNECTIONS_PER_HOST,
+            'max_concurrency': self.max_concurrency,
+            'in_flight': self.in_flight,
+            'hosts': {host: dict(counts) for host, counts in list(self._host_stats.items())}
+        }
+
+async_engine = AsyncVerificationEngine() if aiohttp is not None else None
+if async_engine is not None:
+    atexit.register(async_engine.shutdown)
+
+def _copy_future_state(target, source):
+    if source.cancelled():
+        target.cancel()
+    elif source.exception() is not None:
+        target.set_exception(source.exception())
+    else:
+        target.set_result(source.result())
+
+class ThreadVerificationEngine:
+    """Sync fallback engine: verify_profile on a shared ThreadPoolExecutor.
+    
+    Checks that the rate scheduler says must wait are parked in a heap and
+    handed to the executor by a dispatcher thread when they are due, so no
+    worker thread sleeps waiting for its turn.
+    """
+    
+    def __init__(self, max_workers=THREAD_POOL_WORKERS):
+        self.max_workers = max_workers
+        self.in_flight = 0
+        self._lock = threading.Lock()
+        self._cond = threading.Condition(self._lock)
+        self._heap = []
+        self._seq = 0
+        self._executor = None
+        self._dispatcher = None
+    
+    def _ensure_started(self):
+        # Started lazily so gunicorn workers each get their own threads after fork
+        if self._dispatcher is None or not self._dispatcher.is_alive():
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+            self._dispatcher = threading.Thread(target=self._dispatch_loop, name='osint-dispatcher', daemon=True)
+            self._dispatcher.start()
+    
+    def _dispatch_loop(self):
+        while True:
+            with self._cond:
+                while not self._heap or self._heap[0][0] > time.monotonic():
+                    self._cond.wait(self._heap[0][0] - time.monotonic() if self._heap else None)
+                due, seq, future, args = heapq.heappop(self._heap)
+            
+            # A 429 may have paused the platform since this check was scheduled
+            wait = rate_scheduler.backoff_remaining(args[1])
+            if wait > 0:
+                self._schedule(wait, future, args)
+            elif future.set_running_or_notify_cancel():
+                inner = self._executor.submit(self._run_check, time.perf_counter(), *args)
+                inner.add_done_callback(partial(_copy_future_state, future))
+    
+    def _schedule(self, delay, future, args):
+        with self._cond:
+            self._seq += 1
+            heapq.heappush(self._heap, (time.monotonic() + delay, self._seq, future, args))
+            self._cond.notify()
+    
+    def _run_check(self, dispatched, username, platform_name, platform_info, timeout, deadline, validators):
+        CHECKS_WAITING.dec(engine='threads')
+        observe_phases({'queue_wait': time.perf_counter() - dispatched})
+        CHECKS_IN_FLIGHT.inc(engine='threads')
+        with self._lock:
+            self.in_flight += 1
+        try:
+            timeout = timeout or latency_tracker.timeout_for(platform_name)
+            budget = check_budget(timeout, deadline)
+            if budget <= 0:
+                rate_scheduler.release(platform_name)
+                return cut_short_result(username, platform_name, platform_info)
+            result = verify_profile(username, platform_name, platform_info, budget, validators, deadline)
+            return settle_budget(result, timeout, budget)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+            CHECKS_IN_FLIGHT.dec(engine='threads')
+    
+    def submit(self, username, platform_name, platform_info, timeout=None, deadline=None, validators=None):
+        """Schedule a check and return a concurrent future (timeout None = adaptive)"""
+        with self._lock:
+            self._ensure_started()
+        args = (username, platform_name, platform_info, timeout, deadline, validators)
+        delay = rate_scheduler.reserve(platform_name, platform_info)
+        CHECKS_WAITING.inc(engine='threads')
+        observe_phases({'rate_limit_wait': max(delay, 0.0)})
+        if delay <= 0:
+            future = self._executor.submit(self._run_check, time.perf_counter(), *args)
+            future.add_done_callback(partial(self._on_cancelled, platform_name))
+            return future
+        future = Future()
+        future.add_done_callback(partial(self._on_cancelled, platform_name))
+        self._schedule(delay, future, args)
+        return future
+    
+    def _on_cancelled(self, platform_name, future):
+        # Checks cancelled before they start never reach _run_check or use their token
+        if future.cancelled():
+            CHECKS_WAITING.dec(engine='threads')
+            rate_scheduler.release(platform_name)
+    
+    def stats(self):
+        """Connection usage statistics per host"""
+        with self._lock:
+            scheduled = len(self._heap)
+        return dict(session_pool.stats(), max_workers=self.max_workers, in_flight=self.in_flight, scheduled=scheduled)
+
+thread_engine = ThreadVerificationEngine()
+
+def _shard_worker_main(inbox, outbox):
+    """Child process loop: run checks from inbox on a local engine and post results to outbox"""
+    global WORKER_MODE
+    WORKER_MODE = 'inline'  # The child runs checks itself instead of sharding them again
+    engine = get_verification_engine()
+    futures = {}  # check_id -> engine future
+    platform_infos = {}  # platform_name -> info, so unpickled copies reuse one compiled matcher
+    lock = threading.Lock()
+    
+    def deliver(check_id, future):
+        with lock:
+            futures.pop(check_id, None)
+        if future.cancelled():
+            return
+        try:
+            outbox.put((check_id, future.result(), None))
+        except Exception as e:
+            outbox.put((check_id, None, f'{type(e).__name__}: {str(e)[:200]}'))
+    
+    while True:
+        message = inbox.get()
+        if message is None:
+            break
+        kind, check_id, args = message
+        if kind == 'cancel':
+            with lock:
+                future = futures.get(check_id)
+            if future is not None:
+                future.cancel()
+            continue
+        
+        username, platform_name, platform_info, timeout, deadline, validators = args
+        if platform_infos.get(platform_name) != platform_info:
+            platform_infos[platform_name] = platform_info
+        future = engine.submit(username, platform_name, platform_infos[platform_name], timeout, deadline, validators)
+        with lock:
+            futures[check_id] = future
+        future.add_done_callback(partial(deliver, check_id))
+
+class ProcessShardEngine:
+    """Shards checks across spawned child processes, each running its own engine.
+    
+    Checks are routed by a hash of the target host, so every platform is
+    served by one child and its keep-alive connections, rate limit bucket
+    and page scanning stay together while CPU work spreads over cores. The
+    parent keeps the cache, coalescing, circuit breakers, adaptive timeouts
+    and deadlines, and hands back ordinary futures, so searches and jobs
+    merge results exactly as with the in-process engines. Children are
+    spawned on first use, so the first search in a worker pays their import
+    time; a child that dies is restarted on the next submit and its
+    unfinished checks fail.
+    """
+    
+    def __init__(self, processes=WORKER_PROCESSES):
+        self.processes = max(processes, 1)
+        self._lock = threading.Lock()
+        self._context = multiprocessing.get_context('spawn')  # Forking a process with live threads is unsafe
+        self._workers = []  # [(process, inbox)] per shard
+        self._outbox = None
+        self._reader = None
+        self._pending = {}  # check_id -> (shard, future)
+        self._ids = itertools.count()
+    
+    def _spawn(self, shard):
+        inbox = self._context.Queue()
+        process = self._context.Process(
+            target=_shard_worker_main, args=(inbox, self._outbox), name=f'osint-shard-{shard}', daemon=True
+        )
+        process.start()
+        return process, inbox
+    
+    def _ensure_started(self):
+        # Returns the futures of checks lost with a dead child; caller fails them outside the lock
+        if not self._workers:
+            self._outbox = self._context.Queue()
+            self._workers = [self._spawn(shard) for shard in range(self.processes)]
+            self._reader = threading.Thread(target=self._read_results, name='osint-shard-reader', daemon=True)
+            self._reader.start()
+            return []
+        
+        lost = []
+        for shard, (process, _) in enumerate(self._workers):
+            if not process.is_alive():
+                logger.error(f"Shard worker {shard} exited with code {process.exitcode}, restarting")
+                self._workers[shard] = self._spawn(shard)
+                lost.extend(future for pending_shard, future in self._pending.values() if pending_shard == shard)
+        return lost
+    
+    def _read_results(self):
+        while True:
+            check_id, result, error = self._outbox.get()
+            with self._lock:
+                entry = self._pending.get(check_id)
+            if entry is None:
+                continue
+            try:
+                if error is not None:
+                    entry[1].set_exception(RuntimeError(error))
+                else:
+                    entry[1].set_result(result)
+            except InvalidStateError:
+                pass  # Cancelled while the child was working on it
+    
+    def _on_done(self, check_id, shard, future):
+        with self._lock:
+            self._pending.pop(check_id, None)
+            inbox = self._workers[shard][1] if self._workers else None
+        if future.cancelled() and inbox is not None:
+            inbox.put(('cancel', check_id, None))
+    
+    def submit(self, username, platform_name, platform_info, timeout=None, deadline=None, validators=None):
+        """Route a check to its host's shard and return a concurrent future (timeout None = adaptive)"""
+        url = platform_info['url'].format(username)
+        shard = zlib.crc32(host_key(url).encode()) % self.processes
+        args = (username, platform_name, platform_info, timeout or latency_tracker.timeout_for(platform_name), deadline, validators)
+        future = Future()
+        with self._lock:
+            lost = self._ensure_started()
+            check_id = next(self._ids)
+            self._pending[check_id] = (shard, future)
+            inbox = self._workers[shard][1]
+        for lost_future in lost:
+            try:
+                lost_future.set_exception(RuntimeError('Shard worker process died'))
+            except InvalidStateError:
+                pass
+        
+        inbox.put(('check', check_id, args))
+        future.add_done_callback(partial(self._on_done, check_id, shard))
+        return future
+    
+    def shutdown(self):
+        """Ask every child to exit once its inbox is drained"""
+        with self._lock:
+            workers, self._workers = self._workers, []
+        for process, inbox in workers:
+            inbox.put(None)
+        for process, _ in workers:
+            process.join(timeout=5)
+    
+    @property
+    def in_flight(self):
+        return len(self._pending)
+    
+    def stats(self):
+        """Shard process status and unfinished checks per shard"""
+        with self._lock:
+            per_shard = [0] * self.processes
+            for shard, _ in self._pending.values():
+                per_shard[shard] += 1
+            alive = sum(1 for process, _ in self._workers if process.is_alive())
+        return {'processes': self.processes, 'alive': alive, 'in_flight': sum(per_shard), 'pending_per_shard': per_shard}
+
+process_engine = ProcessShardEngine()
+atexit.register(process_engine.shutdown)
+
+def get_verification_engine():
+    """Return the process-sharded engine in process mode, else the shared async engine or the thread fallback"""
+    if WORKER_MODE == 'process':
+        return process_engine
+    if USE_ASYNC_ENGINE and async_engine is not None:
+        return async_engine
+    return thread_engine
+
+def thread_connection(local, db_path, schema, timeout=30):
+    """This thread's SQLite connection for db_path, opened in WAL mode with the schema on first use.
+    
+    Connections are created lazily, one per thread, so forked gunicorn
+    workers each open their own.
+    """
+    conn = getattr(local, 'conn', None)
+    if conn is None:
+        conn = sqlite3.connect(db_path, timeout=timeout, isolation_level=None)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.executescript(schema)
+        local.conn = conn
+    return conn
+
+class ResultCache:
+    """Bounded LRU cache of check results keyed by (platform, username).
+    
+    Each entry expires after the TTL configured for its status in CACHE_TTLS,
+    so not-found answers are cached (negative caching) while transient
+    failures are kept briefly or not at all. With db_path set, entries are
+    also written to SQLite so they survive restarts and are shared between
+    gunicorn workers; the in-memory LRU stays in front of it. Expired rows
+    are deleted from the file every CACHE_DB_PRUNE_INTERVAL seconds.
+    """
+    
+    def __init__(self, max_entries=CACHE_MAX_ENTRIES, ttls=CACHE_TTLS, db_path=CACHE_DB_PATH):
+        self.max_entries = max_entries
+        self.ttls = ttls
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # (platform, username) -> (expires_at, result)
+        self._local = threading.local()
+        self._counters = {'hits': 0, 'misses': 0, 'db_hits': 0, 'stores': 0, 'evictions': 0, 'db_pruned': 0}
+        self._last_prune = 0.0
+    
+    SCHEMA = (
+        'CREATE TABLE IF NOT EXISTS results ('
+        '  platform TEXT, username TEXT, result TEXT, expires_at REAL,'
+        '  PRIMARY KEY (platform, username));'
+        'CREATE INDEX IF NOT EXISTS results_expiry ON results (expires_at);'
+    )
+    
+    def _db(self):
+        return thread_connection(self._local, self.db_path, self.SCHEMA, timeout=5)
+    
+    def _remember(self, key, expires_at, result):
+        self._entries[key] = (expires_at, result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._counters['evictions'] += 1
+    
+    def get(self, platform_name, username):
+        """Return a copy of the cached result, or None on a miss"""
+        key = (platform_name, username)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self._counters['hits'] += 1
+                return dict(entry[1])
+            if entry is not None:
+                del self._entries[key]
+        
+        if self.db_path:
+            try:
+                row = self._db().execute(
+                    'SELECT result, expires_at FROM results WHERE platform = ? AND username = ? AND expires_at > ?',
+                    (platform_name, username, now)
+                ).fetchone()
+            except sqlite3.Error as e:
+                logger.warning(f"Result cache read failed: {e}")
+                row = None
+            if row is not None:
+                result = json.loads(row[0])
+                with self._lock:
+                    self._remember(key, row[1], result)
+                    self._counters['hits'] += 1
+                    self._counters['db_hits'] += 1
+                return dict(result)
+        
+        with self._lock:
+            self._counters['misses'] += 1
+        return None
+    
+    def put(self, platform_name, username, result):
+        """Cache a fresh result if its status has a non-zero TTL"""
+        ttl = self.ttls.get(result.get('status'), 0)
+        if ttl <= 0:
+            return
+        key = (platform_name, username)
+        now = time.time()
+        expires_at = now + ttl
+        result = {k: v for k, v in result.items() if k not in ('cached', 'hedged')}
+        with self._lock:
+            self._remember(key, expires_at, result)
+            self._counters['stores'] += 1
+            prune = self.db_path and now - self._last_prune >= CACHE_DB_PRUNE_INTERVAL
+            if prune:
+                self._last_prune = now
+        
+        if self.db_path:
+            try:
+                conn = self._db()
+                conn.execute(
+                    'INSERT OR REPLACE INTO results (platform, username, result, expires_at) VALUES (?, ?, ?, ?)',
+                    (platform_name, username, json.dumps(result), expires_at)
+                )
+                if prune:
+                    pruned = conn.execute('DELETE FROM results WHERE expires_at < ?', (now,)).rowcount
+                    with self._lock:
+                        self._counters['db_pruned'] += pruned
+            except sqlite3.Error as e:
+                logger.warning(f"Result cache write failed: {e}")
+    
+    def stats(self):
+        """Cache size and hit/miss counters"""
+        with self._lock:
+            lookups = self._counters['hits'] + self._counters['misses']
+            return dict(
+                self._counters,
+                entries=len(self._entries),
+                max_entries=self.max_entries,
+                hit_rate=round(self._counters['hits'] / lookups, 3) if lookups else 0.0,
+                persistent=bool(self.db_path)
+            )
+
+result_cache = ResultCache()
+
+class SingleFlight:
+    """Coalesces duplicate in-flight checks onto one shared engine future.
+    
+    The first caller for a (platform, username) starts the check; callers
+    arriving while it runs, from the same search or another one, get their
+    own future resolving to a copy of the shared result, so per-search fields
+    like category never leak between searches. The first caller still waiting
+    when the check lands gets it as a fresh result, to be cached and counted;
+    the others get it marked 'coalesced'. A caller only joins a check
+    running under the same or a later deadline (None being the latest), so
+    a bulk job never inherits an interactive search's budget; otherwise it
+    starts its own check, which later callers then join. The shared check
+    is only cancelled once every caller waiting on it has cancelled.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights = {}  # key -> {'future', 'deadline', 'waiting': callers, 'delivered': bool}
+        self._counters = {'started': 0, 'coalesced': 0}
+    
+    def submit(self, key, start, deadline=None):
+        """Attach to the in-flight check for key, calling start() to begin one if there is none it can share"""
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None or not self._outlasts(flight['deadline'], deadline)
+            if leader:
+                flight = self._flights[key] = {'future': start(), 'deadline': deadline, 'waiting': 0, 'delivered': False}
+            flight['waiting'] += 1
+            self._counters['started' if leader else 'coalesced'] += 1
+        
+        if leader:
+            flight['future'].add_done_callback(partial(self._land, key, flight))
+        else:
+            CHECKS_COALESCED_TOTAL.inc(platform=key[0])
+        
+        caller = Future()
+        caller.add_done_callback(partial(self._leave, key, flight))
+        flight['future'].add_done_callback(partial(self._deliver, caller, flight))
+        return caller
+    
+    @staticmethod
+    def _outlasts(flight_deadline, deadline):
+        # Monotonic deadlines; None means the check runs to its own timeout
+        if flight_deadline is None:
+            return True
+        return deadline is not None and flight_deadline >= deadline
+    
+    def _land(self, key, flight, shared):
+        with self._lock:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+    
+    def _deliver(self, caller, flight, shared):
+        if shared.cancelled():
+            caller.cancel()
+            return
+        if not caller.set_running_or_notify_cancel():
+            return  # The caller gave up before the check finished
+        if shared.exception() is not None:
+            caller.set_exception(shared.exception())
+            return
+        result = dict(shared.result())
+        with self._lock:
+            # Whoever receives the result first owns it, even if the caller that started it gave up
+            fresh = not flight['delivered']
+            flight['delivered'] = True
+        if not fresh:
+            result['coalesced'] = True
+        caller.set_result(result)
+    
+    def _leave(self, key, flight, caller):
+        if not caller.cancelled():
+            return
+        with self._lock:
+            flight['waiting'] -= 1
+            abandoned = flight['waiting'] == 0
+            if abandoned and self._flights.get(key) is flight:
+                del self._flights[key]
+        if abandoned:
+            flight['future'].cancel()
+    
+    def stats(self):
+        """Started vs coalesced check counts"""
+        with self._lock:
+            total = self._counters['started'] + self._counters['coalesced']
+            return dict(
+                self._counters,
+                in_flight=len(self._flights),
+                coalesce_rate=round(self._counters['coalesced'] / total, 3) if total else 0.0
+            )
+
+single_flight = SingleFlight()
+
+def build_checks(usernames_to_check):
+    """List every (platform, username) check a search needs to run, grouped by platform in rank order"""
+    platform_registry.maybe_reload()
+    return [
+        {
+            'category': category,
+            'platform': platform_name,
+            'username': username_variant,
+            'platform_info': platform_info
+        }
+        for category, platform_name, platform_info in platform_registry.entries
+        for username_variant in platform_usernames(platform_info, usernames_to_check)
+    ]
+
+class VariationExpander:
+    """Two-wave expansion of a search over ranked username variations.
+    
+    Wave one checks each platform's best candidate, which is the username
+    itself whenever the platform's rules accept it. A platform's remaining
+    candidates are only queued once that check comes back without a found
+    profile, and only while the search's budget of extra requests lasts.
+    Platforms that are rate limiting, blocking or unreachable are not
+    expanded either, since more requests would fail the same way.
+    """
+    
+    def __init__(self, usernames_to_check, budget=VARIATION_BUDGET):
+        self.budget = budget
+        self.first_wave = []
+        self._later = {}  # platform -> remaining checks, best first
+        for check in build_checks(usernames_to_check):
+            later = self._later.get(check['platform'])
+            if later is None:
+                self._later[check['platform']] = []
+                self.first_wave.append(check)
+            else:
+                later.append(check)
+        self.planned = len(self.first_wave)
+    
+    def follow_up(self, result):
+        """Checks to queue after a result: the platform's variations if its first check found nothing"""
+        later = self._later.pop(result['platform'], None)
+        if not later or self.budget <= 0:
+            return []
+        if result['status'] in ('found', 'blocked', 'rate_limited') or result['status'] in UNANSWERED_STATUSES:
+            return []
+        batch = later[:self.budget]
+        self.budget -= len(batch)
+        self.planned += len(batch)
+        return batch
+
+def skipped_result(check):
+    """Result for a check skipped because its platform's circuit breaker is open"""
+    result = new_result(check['username'], check['platform'], check['platform_info']['url'].format(check['username']))
+    result['status'] = 'skipped_unavailable'
+    result['note'] = f"Platform unavailable after repeated failures, retrying in {circuit_breaker.retry_in(check['platform']):.0f}s"
+    return result
+
+def dispatch_check(check, engine, deadline):
+    """Send a check to the engine unless its platform's circuit breaker is open"""
+    if not circuit_breaker.allow(check['platform']):
+        CHECKS_SKIPPED_TOTAL.inc(platform=check['platform'])
+        future = Future()
+        future.set_result(skipped_result(check))
+        return future
+    return engine.submit(check['username'], check['platform'], check['platform_info'],
+                         deadline=deadline, validators=check.get('validators'))
+
+def submit_check(check, engine=None, deadline=None):
+    """Dispatch one check, answering from the result cache where possible"""
+    cached = result_cache.get(check['platform'], check['username'])
+    CACHE_REQUESTS_TOTAL.inc(result='hit' if cached is not None else 'miss')
+    if cached is not None:
+        cached['cached'] = True
+        future = Future()
+        future.set_result(cached)
+        return future
+    engine = engine or get_verification_engine()
+    # Conditional checks can come back 304, so they only share flights with identical validators
+    key = (check['platform'], check['username'])
+    if check.get('validators') is not None:
+        key += tuple(sorted(check['validators'].items()))
+    return single_flight.submit(
+        key,
+        partial(dispatch_check, check, engine, deadline),
+        deadline
+    )
+
+def record_check_metrics(result):
+    """Count a fresh check's latency and outcome"""
+    CHECK_DURATION.observe(result['response_time'] / 1000, platform=result['platform'], status=result['status'])
+    if result['status'] not in UNANSWERED_STATUSES or result['status'] == 'timeout':
+        latency_tracker.record(result['platform'], result['response_time'] / 1000, timed_out=result['status'] == 'timeout')
+    if result['status'] == 'rate_limited':
+        RATE_LIMITED_TOTAL.inc(platform=result['platform'])
+    elif result['status'] == 'timeout':
+        TIMEOUTS_TOTAL.inc(platform=result['platform'])
+    elif result['status'] == 'cut_short':
+        CHECKS_CUT_SHORT_TOTAL.inc(platform=result['platform'])
+
+def is_fresh(result):
+    """Whether a result comes from a request made for this caller, not the cache, another search or a breaker"""
+    return not (result.get('cached') or result.get('coalesced') or result['status'] == 'skipped_unavailable')
+
+def collect_result(future, check):
+    """Turn a finished check future into a result dict, caching fresh results"""
+    try:
+        result = future.result()
+        if is_fresh(result):
+            result_cache.put(check['platform'], check['username'], result)
+            circuit_breaker.record(check['platform'], result['status'])
+            record_check_metrics(result)
+        result['category'] = check['category']
+    except Exception as e:
+        # Handle individual task failures
+        result = {
+            'platform': check['platform'],
+            'category': check['category'],
+            'username': check['username'],
+            'url': '',
+            'status': 'error',
+            'response_time': 0,
+            'confidence': 0,
+            'note': f'Task failed: {str(e)[:50]}'
+        }
+        logger.error(f"Task failed for {check['platform']}/{check['username']}: {e}")
+    return result
+
+def iter_check_results(checks, deadline=None, follow_up=None):
+    """Run the checks concurrently and yield each result as soon as it completes.
+    
+    follow_up(result), if given, returns further checks to start once a
+    result is in; variation waves are queued this way. With a deadline (a
+    time.monotonic() value), checks still unfinished when it passes are
+    cancelled and yielded as cut_short results instead.
+    """
+    engine = get_verification_engine()
+    future_to_info = {}
+    pending = set()
+    completed = SimpleQueue()
+    
+    def submit(batch):
+        for check in batch:
+            future = submit_check(check, engine, deadline)
+            future_to_info[future] = check
+            pending.add(future)
+            future.add_done_callback(completed.put)
+    
+    try:
+        # Submit all verification tasks
+        submit(checks)
+        
+        # Yield results as they complete
+        try:
+            while pending:
+                timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+                future = completed.get(timeout=timeout)
+                if future not in pending:
+                    continue
+                pending.discard(future)
+                result = collect_result(future, future_to_info[future])
+                yield result
+                if follow_up is not None:
+                    submit(follow_up(result))
+        except Empty:
+            logger.warning(f"Search deadline reached with {len(pending)} checks unfinished")
+            for future in pending:
+                check = future_to_info[future]
+                if future.done() and not future.cancelled():
+                    yield collect_result(future, check)
+                    continue
+                future.cancel()
+                result = cut_short_result(check['username'], check['platform'], check['platform_info'],
+                                          'Search deadline reached before this check finished')
+                result['category'] = check['category']
+                CHECKS_CUT_SHORT_TOTAL.inc(platform=check['platform'])
+                yield result
+    finally:
+        # Caller stopped early (e.g. client disconnected): drop queued checks
+        for future in future_to_info:
+            future.cancel()
+
+def is_verified(result):
+    """Only high confidence results are reported as verified profiles"""
+    return result['status'] in ['found', 'likely_exists'] and result['confidence'] >= 60
+
+class ResultColumns:
+    """Compact store of check results with interned strings.
+    
+    Platform, category, username, status and note values repeat across
+    checks, so each row is a fixed tuple holding them as indexes into one
+    shared string table. A search keeps every check this way, not just the
+    verified ones, so results can be paged or re-read with all checks
+    without running the search again.
+    """
+    
+    __slots__ = ('strings', '_string_ids', 'rows')
+    
+    FIELDS = ('platform', 'category', 'username', 'url', 'status', 'confidence', 'response_time', 'note', 'source', 'verified')
+    INTERNED = (0, 1, 2, 4, 7, 8)  # Positions in FIELDS stored as string table indexes
+    
+    def __init__(self):
+        self.strings = []
+        self._string_ids = {}
+        self.rows = []
+    
+    def __len__(self):
+        return len(self.rows)
+    
+    def _intern(self, value):
+        string_id = self._string_ids.get(value)
+        if string_id is None:
+            string_id = self._string_ids[value] = len(self.strings)
+            self.strings.append(value)
+        return string_id
+    
+    def append(self, result, verified=None):
+        source = 'cached' if result.get('cached') else 'coalesced' if result.get('coalesced') else 'fresh'
+        self.rows.append((
+            self._intern(result['platform']), self._intern(result.get('category', '')), self._intern(result['username']),
+            result['url'], self._intern(result['status']), result['confidence'], result['response_time'],
+            self._intern(result['note']), self._intern(source), is_verified(result) if verified is None else verified
+        ))
+    
+    def page(self, cursor=0, limit=None, verified_only=True):
+        """Rows from position cursor on; returns (rows, next_cursor), next_cursor None at the end"""
+        rows = []
+        index = max(cursor, 0)
+        total = len(self.rows)
+        while index < total and (limit is None or len(rows) < limit):
+            row = self.rows[index]
+            index += 1
+            if row[9] or not verified_only:
+                rows.append(row)
+        if verified_only:
+            # Skip trailing unverified rows so the last page doesn't point at an empty one
+            while index < total and not self.rows[index][9]:
+                index += 1
+        return rows, index if index < total else None
+    
+    def to_dicts(self, rows):
+        """Rows as the result dicts the API has always returned, plus a 'verified' flag"""
+        strings = self.strings
+        results = []
+        for row in rows:
+            source = strings[row[8]]
+            result = {
+                'platform': strings[row[0]], 'category': strings[row[1]], 'username': strings[row[2]],
+                'url': row[3], 'status': strings[row[4]], 'confidence': row[5], 'response_time': row[6],
+                'note': strings[row[7]], 'verified': row[9]
+            }
+            if source != 'fresh':
+                result[source] = True
+            results.append(result)
+        return results
+    
+    def to_compact(self, rows):
+        """Rows as arrays under 'columns', interned values given as indexes into 'strings'.
+        
+        The string table is rebuilt for the given rows, so a page only
+        carries the strings it uses.
+        """
+        strings = []
+        string_ids = {}
+        packed = []
+        for row in rows:
+            row = list(row)
+            for position in self.INTERNED:
+                string_id = string_ids.get(row[position])
+                if string_id is None:
+                    string_id = string_ids[row[position]] = len(strings)
+                    strings.append(self.strings[row[position]])
+                row[position] = string_id
+            packed.append(row)
+        return {'columns': self.FIELDS, 'strings': strings, 'rows': packed}
+    
+    def encode(self, rows, result_format):
+        return self.to_compact(rows) if result_format == 'compact' else self.to_dicts(rows)
+
+class SearchResultStore:
+    """Recent searches' full result sets, kept so they can be paged afterwards.
+    
+    In memory per worker process, evicting the oldest search past
+    max_entries and expiring searches after ttl seconds. With several
+    gunicorn workers a search's results_url only resolves on the worker
+    that ran it; use a bulk job when results must outlive the worker.
+    """
+    
+    def __init__(self, max_entries=SEARCH_RESULTS_KEEP, ttl=SEARCH_RESULTS_TTL):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # search_id -> (expires_at, results)
+    
+    def put(self, results):
+        """Keep a search's results and return its search_id (None when keeping is disabled)"""
+        if self.max_entries <= 0:
+            return None
+        search_id = uuid.uuid4().hex
+        with self._lock:
+            self._entries[search_id] = (time.time() + self.ttl, results)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return search_id
+    
+    def get(self, search_id):
+        with self._lock:
+            entry = self._entries.get(search_id)
+            if entry is None:
+                return None
+            if entry[0] <= time.time():
+                del self._entries[search_id]
+                return None
+            return entry[1]
+
+search_results = SearchResultStore()
+
+class SearchSummary:
+    """Accumulates the statistics reported for a search one result at a time"""
+    
+    def __init__(self, username, usernames_to_check, include_variations, keep_results=True):
+        self.username = username
+        self.usernames_to_check = usernames_to_check
+        self.include_variations = include_variations
+        self.keep_results = keep_results
+        self.results = ResultColumns() if keep_results else None
+        self.total_found = 0
+        self.total_checks = 0
+        self.platforms = set()
+        self.response_time_total = 0
+        self.response_time_count = 0
+        self.cut_short = 0
+        self.usernames = set()
+    
+    def add(self, result):
+        """Record a result, returning True if it counts as a verified profile"""
+        self.total_checks += 1
+        self.platforms.add(result['platform'])
+        self.usernames.add(result['username'])
+        if result['status'] == 'cut_short':
+            self.cut_short += 1
+        if result['response_time'] > 0:
+            self.response_time_total += result['response_time']
+            self.response_time_count += 1
+        
+        verified = is_verified(result)
+        if verified:
+            self.total_found += 1
+        if self.keep_results:
+            self.results.append(result, verified)
+        return verified
+    
+    def to_dict(self, include_all=False, result_format='full', limit=None):
+        """Summary with the verified results (every check with include_all), up to limit of them"""
+        summary = {
+            'username': self.username,
+            'total_found': self.total_found,
+            'platforms_checked': len(self.platforms),
+            'avg_response_time': int(self.response_time_total / max(self.response_time_count, 1)),
+            'partial': self.cut_short > 0,
+            'debug_info': {
+                'total_checks': self.total_checks,
+                'cut_short': self.cut_short,
+                'variations_used': len(self.usernames),
+                'include_variations': self.include_variations
+            }
+        }
+        if self.keep_results:
+            rows, summary['next_cursor'] = self.results.page(0, limit, verified_only=not include_all)
+            summary['results'] = self.results.encode(rows, result_format)
+        return summary
+
+def get_platform(platform_name):
+    """Look up a platform's category and info by name, or (None, None)"""
+    return platform_registry.index.get(platform_name, (None, None))
+
+class JobQueue:
+    """Persistent SQLite queue of bulk search jobs and their checks.
+    
+    Every (platform, username) pair in a job is stored once, so duplicate
+    handles and overlapping variations in a batch are only checked once.
+    Workers claim pending checks in batches inside an IMMEDIATE transaction,
+    which lets several gunicorn workers share one queue file; checks claimed
+    by a worker that died are handed out again after JOB_CLAIM_TIMEOUT.
+    Checks deferred with defer() stay pending until their retry time.
+    """
+    
+    SCHEMA = (
+        'CREATE TABLE IF NOT EXISTS jobs ('
+        '  id TEXT PRIMARY KEY, status TEXT, usernames INTEGER, include_variations INTEGER,'
+        '  total_checks INTEGER, created_at REAL, finished_at REAL);'
+        'CREATE TABLE IF NOT EXISTS job_checks ('
+        '  id INTEGER PRIMARY KEY, job_id TEXT, platform TEXT, username TEXT, category TEXT,'
+        '  state TEXT, claimed_at REAL, UNIQUE (job_id, platform, username));'
+        'CREATE INDEX IF NOT EXISTS job_checks_state ON job_checks (state, id);'
+        'CREATE TABLE IF NOT EXISTS job_results ('
+        '  id INTEGER PRIMARY KEY AUTOINCREMENT, job_id TEXT, verified INTEGER, result TEXT);'
+        'CREATE INDEX IF NOT EXISTS job_results_job ON job_results (job_id, id);'
+    )
+    
+    def __init__(self, db_path=JOBS_DB_PATH):
+        self.db_path = db_path
+        self._local = threading.local()
+    
+    def _db(self):
+        return thread_connection(self._local, self.db_path, self.SCHEMA)
+    
+    def create_job(self, usernames, include_variations):
+        """Queue a job and return (job_id, total_checks, duplicates_removed)"""
+        job_id = uuid.uuid4().hex
+        rows = []
+        for username in usernames:
+            usernames_to_check = generate_variations(username) if include_variations else [username]
+            for check in build_checks(usernames_to_check):
+                rows.append((job_id, check['platform'], check['username'], check['category'], 'pending'))
+        
+        conn = self._db()
+        with conn:
+            conn.execute('BEGIN IMMEDIATE')
+            conn.executemany(
+                'INSERT OR IGNORE INTO job_checks (job_id, platform, username, category, state) VALUES (?, ?, ?, ?, ?)',
+                rows
+            )
+            total = conn.execute('SELECT COUNT(*) FROM job_checks WHERE job_id = ?', (job_id,)).fetchone()[0]
+            conn.execute(
+                'INSERT INTO jobs (id, status, usernames, include_variations, total_checks, created_at) VALUES (?, ?, ?, ?, ?, ?)',
+                (job_id, 'queued' if total else 'completed', len(usernames), int(bool(include_variations)), total, time.time())
+            )
+        return job_id, total, len(rows) - total
+    
+    def claim(self, limit):
+        """Mark up to limit pending checks as running and return them"""
+        now = time.time()
+        conn = self._db()
+        with conn:
+            conn.execute('BEGIN IMMEDIATE')
+            rows = conn.execute(
+                "SELECT id, job_id, platform, username, category FROM job_checks "
+                "WHERE (state = 'pending' AND (claimed_at IS NULL OR claimed_at <= ?)) "
+                "OR (state = 'running' AND claimed_at < ?) ORDER BY id LIMIT ?",
+                (now, now - JOB_CLAIM_TIMEOUT, limit)
+            ).fetchall()
+            if rows:
+                conn.executemany(
+                    "UPDATE job_checks SET state = 'running', claimed_at = ? WHERE id = ?",
+                    [(now, row[0]) for row in rows]
+                )
+                conn.executemany(
+                    "UPDATE jobs SET status = 'running' WHERE id = ? AND status = 'queued'",
+                    {(row[1],) for row in rows}
+                )
+        return rows
+    
+    def complete(self, check_id, job_id, result):
+        """Store a check's result and mark the job finished once nothing is left"""
+        conn = self._db()
+        with conn:
+            conn.execute('BEGIN IMMEDIATE')
+            updated = conn.execute(
+                "UPDATE job_checks SET state = 'done' WHERE id = ? AND state = 'running'", (check_id,)
+            ).rowcount
+            if not updated:
+                return  # Cancelled, or already completed by another worker after a reclaim
+            conn.execute(
+                'INSERT INTO job_results (job_id, verified, result) VALUES (?, ?, ?)',
+                (job_id, int(is_verified(result)), json_dumps(result))
+            )
+            remaining = conn.execute(
+                "SELECT 1 FROM job_checks WHERE job_id = ? AND state IN ('pending', 'running') LIMIT 1", (job_id,)
+            ).fetchone()
+            if remaining is None:
+                conn.execute(
+                    "UPDATE jobs SET status = 'completed', finished_at = ? WHERE id = ? AND status = 'running'",
+                    (time.time(), job_id)
+                )
+    
+    def defer(self, check_id, retry_at):
+        """Put a running check back as pending, not to be claimed before retry_at"""
+        conn = self._db()
+        with conn:
+            conn.execute(
+                "UPDATE job_checks SET state = 'pending', claimed_at = ? WHERE id = ? AND state = 'running'",
+                (retry_at, check_id)
+            )
+    
+    def cancel(self, job_id):
+        """Drop a job's unfinished checks; returns False if the job does not exist"""
+        conn = self._db()
+        with conn:
+            conn.execute('BEGIN IMMEDIATE')
+            updated = conn.execute(
+                "UPDATE jobs SET status = 'cancelled', finished_at = ? WHERE id = ? AND status IN ('queued', 'running')",
+                (time.time(), job_id)
+            ).rowcount
+            conn.execute(
+                "UPDATE job_checks SET state = 'cancelled' WHERE job_id = ? AND state IN ('pending', 'running')", (job_id,)
+            )
+            exists = conn.execute('SELECT 1 FROM jobs WHERE id = ?', (job_id,)).fetchone()
+        return updated > 0 or exists is not None
+    
+    def progress(self, job_id):
+        """Job status and per-state check counts, or None if the job does not exist"""
+        conn = self._db()
+        job = conn.execute(
+            'SELECT status, usernames, include_variations, total_checks, created_at, finished_at FROM jobs WHERE id = ?',
+            (job_id,)
+        ).fetchone()
+        if job is None:
+            return None
+        
+        states = dict(conn.execute(
+            'SELECT state, COUNT(*) FROM job_checks WHERE job_id = ? GROUP BY state', (job_id,)
+        ).fetchall())
+        total_found = conn.execute(
+            'SELECT COUNT(*) FROM job_results WHERE job_id = ? AND verified = 1', (job_id,)
+        ).fetchone()[0]
+        
+        status, usernames, include_variations, total_checks, created_at, finished_at = job
+        completed = states.get('done', 0)
+        return {
+            'job_id': job_id,
+            'status': status,
+            'usernames': usernames,
+            'include_variations': bool(include_variations),
+            'total_checks': total_checks,
+            'completed_checks': completed,
+            'pending_checks': states.get('pending', 0),
+            'running_checks': states.get('running', 0),
+            'cancelled_checks': states.get('cancelled', 0),
+            'progress': round(completed / total_checks, 4) if total_checks else 1.0,
+            'total_found': total_found,
+            'created_at': created_at,
+            'finished_at': finished_at
+        }
+    
+    def results(self, job_id, cursor=0, limit=100, verified_only=True, raw=False):
+        """Page through a job's results in completion order; returns (results, next_cursor).
+        
+        With raw=True the results are returned as their stored JSON strings.
+        """
+        query = 'SELECT id, result FROM job_results WHERE job_id = ? AND id > ?'
+        if verified_only:
+            query += ' AND verified = 1'
+        rows = self._db().execute(query + ' ORDER BY id LIMIT ?', (job_id, cursor, limit)).fetchall()
+        next_cursor = rows[-1][0] if len(rows) == limit else None
+        if raw:
+            return [row[1] for row in rows], next_cursor
+        return [json.loads(row[1]) for row in rows], next_cursor
+
+class JobRunner:
+    """Background thread feeding queued job checks into the verification engine.
+    
+    At most JOB_CONCURRENCY job checks are in flight per worker process at
+    any time, so bulk jobs cannot starve interactive searches.
+    """
+    
+    def __init__(self, queue, concurrency=JOB_CONCURRENCY):
+        self.queue = queue
+        self.concurrency = concurrency
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+    
+    def ensure_started(self):
+        # Started lazily so gunicorn workers each get their own runner after fork
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='osint-job-runner', daemon=True)
+                self._thread.start()
+        self._wakeup.set()
+    
+    def _run(self):
+        in_flight = {}  # future -> (check_id, job_id, check)
+        while True:
+            try:
+                capacity = self.concurrency - len(in_flight)
+                claimed = self.queue.claim(capacity) if capacity > 0 else []
+                for check_id, job_id, platform_name, username, category in claimed:
+                    _, platform_info = get_platform(platform_name)
+                    check = {'category': category, 'platform': platform_name, 'username': username, 'platform_info': platform_info}
+                    if platform_info is None:
+                        future = Future()
+                        future.set_exception(LookupError(f'Unknown platform {platform_name}'))
+                    else:
+                        future = submit_check(check)
+                    in_flight[future] = (check_id, job_id, check)
+                
+                if not in_flight:
+                    self._wakeup.wait(JOB_POLL_INTERVAL)
+                    self._wakeup.clear()
+                    continue
+                
+                done, _ = wait(list(in_flight), timeout=JOB_POLL_INTERVAL, return_when=FIRST_COMPLETED)
+                for future in done:
+                    check_id, job_id, check = in_flight.pop(future)
+                    result = collect_result(future, check)
+                    if result['status'] == 'skipped_unavailable':
+                        # The platform's breaker is open: retry once it half-opens instead of recording a gap
+                        self.queue.defer(check_id, time.time() + max(circuit_breaker.retry_in(check['platform']), 1.0))
+                        continue
+                    self.queue.complete(check_id, job_id, result)
+            except Exception as e:
+                logger.error(f"Job runner error: {e}")
+                time.sleep(JOB_POLL_INTERVAL)
+
+job_queue = JobQueue()
+job_runner = JobRunner(job_queue)
+
+def result_fingerprint(result):
+    """Short hash of a result's classification (status, confidence and note), not of the page itself"""
+    evidence = f"{result['status']}|{result['confidence']}|{result['note']}"
+    return hashlib.sha1(evidence.encode('utf-8')).hexdigest()[:16]
+
+class Watchlist:
+    """Persistent SQLite watchlist of (platform, username) pairs re-checked over time.
+    
+    Each entry keeps its last definitive status, a fingerprint of how it
+    was classified and the page's ETag/Last-Modified, so re-checks go out
+    as conditional requests that a 304 settles without a body. A re-check
+    whose status differs is logged as a 'status' change; one with the same
+    status but a different confidence or note (e.g. other existence
+    indicators matched) as an 'evidence' change. An entry is due again
+    WATCHLIST_INTERVAL after a check; the interval doubles, up to
+    WATCHLIST_MAX_INTERVAL, each time it comes back unchanged and resets
+    when it changes. Checks that get no real answer keep the last known
+    status and are retried after WATCHLIST_RETRY_INTERVAL. Entries remember
+    the username they were added under (watched_as), so removing it also
+    drops its variations.
+    """
+    
+    SCHEMA = (
+        'CREATE TABLE IF NOT EXISTS watch_entries ('
+        '  platform TEXT, username TEXT, watched_as TEXT, category TEXT, status TEXT, confidence INTEGER, url TEXT,'
+        '  fingerprint TEXT, etag TEXT, last_modified TEXT, added_at REAL, checked_at REAL,'
+        '  changed_at REAL, next_check_at REAL, unchanged_streak INTEGER DEFAULT 0,'
+        '  PRIMARY KEY (platform, username));'
+        'CREATE INDEX IF NOT EXISTS watch_entries_due ON watch_entries (next_check_at);'
+        'CREATE INDEX IF NOT EXISTS watch_entries_watched_as ON watch_entries (watched_as);'
+        'CREATE TABLE IF NOT EXISTS watch_changes ('
+        '  id INTEGER PRIMARY KEY AUTOINCREMENT, platform TEXT, username TEXT, url TEXT, kind TEXT,'
+        '  old_status TEXT, new_status TEXT, confidence INTEGER, note TEXT, detected_at REAL);'
+    )
+    
+    def __init__(self, db_path=WATCHLIST_DB_PATH):
+        self.db_path = db_path
+        self._local = threading.local()
+    
+    def _db(self):
+        return thread_connection(self._local, self.db_path, self.SCHEMA)
+    
+    def add(self, usernames, include_variations):
+        """Watch every platform check for the usernames; returns (added, already_watched)"""
+        now = time.time()
+        rows = []
+        for username in usernames:
+            usernames_to_check = generate_variations(username) if include_variations else [username]
+            for check in build_checks(usernames_to_check):
+                rows.append((check['platform'], check['username'], username, check['category'], now))
+        
+        conn = self._db()
+        with conn:
+            conn.execute('BEGIN IMMEDIATE')
+            before = conn.execute('SELECT COUNT(*) FROM watch_entries').fetchone()[0]
+            conn.executemany(
+                'INSERT OR IGNORE INTO watch_entries (platform, username, watched_as, category, added_at, next_check_at)'
+                ' VALUES (?, ?, ?, ?, ?, 0)',
+                rows
+            )
+            added = conn.execute('SELECT COUNT(*) FROM watch_entries').fetchone()[0] - before
+        return added, len(rows) - added
+    
+    def remove(self, username):
+        """Stop watching a username and the variations added with it; returns the number of entries removed"""
+        conn = self._db()
+        with conn:
+            return conn.execute(
+                'DELETE FROM watch_entries WHERE watched_as = ? OR username = ?', (username, username)
+            ).rowcount
+    
+    def claim_due(self, limit, due_before):
+        """Claim up to limit entries due before due_before, returning (platform, username, category, etag, last_modified)"""
+        conn = self._db()
+        with conn:
+            conn.execute('BEGIN IMMEDIATE')
+            rows = conn.execute(
+                'SELECT platform, username, category, etag, last_modified FROM watch_entries '
+                'WHERE next_check_at <= ? ORDER BY next_check_at LIMIT ?',
+                (due_before, limit)
+            ).fetchall()
+            # Push claimed entries out so another worker's scan skips them; record() sets the real time
+            conn.executemany(
+                'UPDATE watch_entries SET next_check_at = ? WHERE platform = ? AND username = ?',
+                [(time.time() + JOB_CLAIM_TIMEOUT, row[0], row[1]) for row in rows]
+            )
+        return rows
+    
+    def record(self, platform_name, username, result):
+        """Store a re-check's outcome; returns 'baseline' (an entry's first answer), 'changed', 'unchanged', 'not_modified' or 'failed'"""
+        now = time.time()
+        conn = self._db()
+        with conn:
+            conn.execute('BEGIN IMMEDIATE')
+            row = conn.execute(
+                'SELECT status, fingerprint, unchanged_streak, etag, last_modified FROM watch_entries'
+                ' WHERE platform = ? AND username = ?',
+                (platform_name, username)
+            ).fetchone()
+            if row is None:
+                return 'failed'  # Removed while the check was running
+            old_status, old_fingerprint, streak, etag, last_modified = row
+            status = result['status']
+            
+            if status == 'not_modified' or status in ('blocked', 'rate_limited') or status in UNANSWERED_STATUSES:
+                outcome = 'not_modified' if status == 'not_modified' and old_status is not None else 'failed'
+                if outcome == 'not_modified':
+                    streak += 1
+                conn.execute(
+                    'UPDATE watch_entries SET checked_at = ?, next_check_at = ?, unchanged_streak = ? WHERE platform = ? AND username = ?',
+                    (now, now + self._interval(streak) if outcome == 'not_modified' else now + WATCHLIST_RETRY_INTERVAL,
+                     streak, platform_name, username)
+                )
+                return outcome
+            
+            fingerprint = result_fingerprint(result)
+            kind = None
+            if old_status is not None and old_status != status:
+                kind = 'status'
+            elif old_fingerprint is not None and old_fingerprint != fingerprint:
+                kind = 'evidence'
+            streak = 0 if kind or old_status is None else streak + 1
+            conn.execute(
+                'UPDATE watch_entries SET status = ?, confidence = ?, url = ?, fingerprint = ?, etag = ?, last_modified = ?,'
+                ' checked_at = ?, changed_at = CASE WHEN ? THEN ? ELSE changed_at END, next_check_at = ?, unchanged_streak = ?'
+                ' WHERE platform = ? AND username = ?',
+                (status, result['confidence'], result['url'], fingerprint,
+                 result.get('etag', etag), result.get('last_modified', last_modified),
+                 now, kind is not None or old_status is None, now, now + self._interval(streak), streak, platform_name, username)
+            )
+            if kind:
+                conn.execute(
+                    'INSERT INTO watch_changes (platform, username, url, kind, old_status, new_status, confidence, note, detected_at)'
+                    ' VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                    (platform_name, username, result['url'], kind, old_status, status, result['confidence'], result['note'], now)
+                )
+        if old_status is None:
+            return 'baseline'
+        return 'changed' if kind else 'unchanged'
+    
+    def _interval(self, streak):
+        return min(WATCHLIST_INTERVAL * (2 ** min(streak, 16)), WATCHLIST_MAX_INTERVAL)
+    
+    def overview(self, username=None):
+        """Entry counts by status and how many are due, optionally listing one username's entries"""
+        conn = self._db()
+        statuses = dict(conn.execute(
+            "SELECT COALESCE(status, 'unchecked'), COUNT(*) FROM watch_entries GROUP BY 1"
+        ).fetchall())
+        due = conn.execute('SELECT COUNT(*) FROM watch_entries WHERE next_check_at <= ?', (time.time(),)).fetchone()[0]
+        overview = {'entries': sum(statuses.values()), 'due': due, 'statuses': statuses}
+        if username is not None:
+            columns = ('platform', 'username', 'category', 'status', 'confidence', 'url', 'checked_at', 'changed_at', 'next_check_at')
+            rows = conn.execute(
+                f"SELECT {', '.join(columns)} FROM watch_entries WHERE watched_as = ? OR username = ? ORDER BY platform, username",
+                (username, username)
+            ).fetchall()
+            overview['watched'] = [dict(zip(columns, row)) for row in rows]
+        return overview
+    
+    def changes(self, cursor=0, limit=100):
+        """Page through detected changes, oldest first; returns (changes, next_cursor)"""
+        columns = ('id', 'platform', 'username', 'url', 'kind', 'old_status', 'new_status', 'confidence', 'note', 'detected_at')
+        rows = self._db().execute(
+            f"SELECT {', '.join(columns)} FROM watch_changes WHERE id > ? ORDER BY id LIMIT ?", (cursor, limit)
+        ).fetchall()
+        next_cursor = rows[-1][0] if len(rows) == limit else None
+        return [dict(zip(columns, row)) for row in rows], next_cursor
+
+class WatchlistScanner:
+    """Background thread re-checking the watchlist entries that are due.
+    
+    A scan takes entries due when it started in batches of WATCHLIST_BATCH,
+    so entries retried later in the same scan don't keep it running. One
+    scan runs at a time per worker process; claims keep concurrent workers
+    off each other's entries.
+    """
+    
+    def __init__(self, watchlist, batch_size=WATCHLIST_BATCH):
+        self.watchlist = watchlist
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        self._thread = None
+        self.last_scan = None
+    
+    def start(self):
+        """Start a scan unless one is already running; returns False if it was"""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return False
+            self.last_scan = {'started_at': time.time(), 'finished_at': None, 'checked': 0,
+                              'baseline': 0, 'changed': 0, 'unchanged': 0, 'not_modified': 0, 'failed': 0}
+            self._thread = threading.Thread(target=self._run, args=(self.last_scan,), name='osint-watchlist-scan', daemon=True)
+            self._thread.start()
+            return True
+    
+    def _run(self, scan):
+        try:
+            while True:
+                rows = self.watchlist.claim_due(self.batch_size, scan['started_at'])
+                if not rows:
+                    break
+                checks = []
+                for platform_name, username, category, etag, last_modified in rows:
+                    _, platform_info = get_platform(platform_name)
+                    if platform_info is None:
+                        continue  # Dropped from the catalog; the entry stays until removed
+                    checks.append({'category': category, 'platform': platform_name, 'username': username,
+                                   'platform_info': platform_info,
+                                   'validators': {'etag': etag, 'last_modified': last_modified}})
+                for result in iter_check_results(checks):
+                    outcome = self.watchlist.record(result['platform'], result['username'], result)
+                    scan['checked'] += 1
+                    scan[outcome] += 1
+                    if outcome == 'changed':
+                        logger.info(f"Watchlist change: {result['platform']}/{result['username']} is now {result['status']}")
+        except Exception as e:
+            logger.error(f"Watchlist scan error: {e}")
+        finally:
+            scan['finished_at'] = time.time()
+            logger.info(f"Watchlist scan finished: {scan['checked']} checked, {scan['baseline']} baselined, "
+                        f"{scan['changed']} changed, {scan['not_modified']} not modified")
+
+watchlist = Watchlist()
+watchlist_scanner = WatchlistScanner(watchlist)
+
+def json_bytes(obj):
+    """Serialize to compact UTF-8 JSON, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+def json_dumps(obj):
+    return json_bytes(obj).decode('utf-8')
+
+def accepted_encodings():
+    """Content codings the client accepts, from its Accept-Encoding header"""
+    encodings = set()
+    for part in request.headers.get('Accept-Encoding', '').split(','):
+        name, _, params = part.partition(';')
+        q = params.replace(' ', '').partition('q=')[2]
+        try:
+            if q and float(q) == 0:
+                continue
+        except ValueError:
+            continue
+        encodings.add(name.strip().lower())
+    return encodings
+
+def body_response(body, status=200, mimetype='application/json'):
+    """Response for an encoded body, compressed with brotli or gzip when the client accepts it"""
+    headers = {'Vary': 'Accept-Encoding'}
+    if len(body) >= COMPRESS_MIN_BYTES:
+        encodings = accepted_encodings()
+        if brotli is not None and 'br' in encodings:
+            body = brotli.compress(body, quality=COMPRESS_BROTLI_QUALITY)
+            headers['Content-Encoding'] = 'br'
+        elif 'gzip' in encodings:
+            body = gzip.compress(body, compresslevel=COMPRESS_GZIP_LEVEL)
+            headers['Content-Encoding'] = 'gzip'
+    return Response(body, status=status, mimetype=mimetype, headers=headers)
+
+def json_response(payload, status=200):
+    """jsonify() replacement for large payloads: faster encoding and optional compression"""
+    return body_response(json_bytes(payload), status)
+
+def result_format_arg(value):
+    """Validate a 'format' option: 'full' result dicts (the default) or 'compact' rows"""
+    value = value or 'full'
+    if value not in RESULT_FORMATS:
+        raise ValueError(f"format must be one of: {', '.join(RESULT_FORMATS)}")
+    return value
+
+def search_deadline(data):
+    """Monotonic deadline for a search: the request's 'deadline' seconds, capped at SEARCH_DEADLINE"""
+    budget = SEARCH_DEADLINE
+    try:
+        budget = min(float((data or {}).get('deadline') or budget), budget)
+    except (TypeError, ValueError):
+        pass
+    return time.monotonic() + max(budget, 0)
+
+def parse_search_request(data):
+    """Read the username and variation options from a search request body"""
+    username = (data or {}).get('username', '').strip()
+    include_variations = (data or {}).get('includeVariations', False)
+    
+    # Generate variations if requested
+    usernames_to_check = [username]
+    if username and include_variations:
+        usernames_to_check = generate_variations(username)
+        logger.info(f"Generated {len(usernames_to_check)} variations")
+    
+    return username, include_variations, usernames_to_check
+
+def parse_username_list(data):
+    """Read a bulk request's 'usernames' list; returns (usernames, error message or None)"""
+    usernames = data.get('usernames')
+    if not isinstance(usernames, list):
+        return None, 'usernames must be a list'
+    usernames = [u.strip() for u in usernames if isinstance(u, str) and u.strip()]
+    if not usernames:
+        return None, 'At least one username is required'
+    if len(usernames) > JOB_MAX_USERNAMES:
+        return None, f'At most {JOB_MAX_USERNAMES} usernames per request'
+    return usernames, None
+
+@app.route('/api/search', methods=['POST'])
+def search_username():
+    """Main API endpoint for username search.
+    
+    Returns the verified results, or every check with includeAll. 'format':
+    'compact' sends them as interned rows and 'limit' caps how many are
+    inline; the rest are paged from results_url without a second scan.
+    """
+    try:
+        data = request.get_json()
+        deadline = search_deadline(data)
+        username, include_variations, usernames_to_check = parse_search_request(data)
+        
+        if not username:
+            return jsonify({'error': 'Username is required'}), 400
+        
+        try:
+            include_all = bool((data or {}).get('includeAll', False))
+            result_format = result_format_arg((data or {}).get('format'))
+            limit = (data or {}).get('limit')
+            limit = None if limit is None else min(max(int(limit), 1), RESULTS_PAGE_MAX)
+        except (TypeError, ValueError) as e:
+            return jsonify({'error': f'Invalid result options: {e}'}), 400
+        
+        logger.info(f"Starting search for username: {username}")
+        
+        SEARCHES_TOTAL.inc(endpoint='search')
+        summary = SearchSummary(username, usernames_to_check, include_variations)
+        expander = VariationExpander(usernames_to_check)
+        for result in iter_check_results(expander.first_wave, deadline, expander.follow_up):
+            summary.add(result)
+        
+        logger.info(f"Search complete: {summary.total_found} verified profiles found across {len(summary.platforms)} platforms")
+        
+        response = summary.to_dict(include_all, result_format, limit)
+        response['search_id'] = search_results.put(summary.results)
+        if response['search_id'] is not None:
+            response['results_url'] = f"/api/search/{response['search_id']}/results"
+        return json_response(response)
+    
+    except Exception as e:
+        logger.error(f"Search endpoint error: {e}")
+        return jsonify({'error': f'Internal server error: {str(e)}'}), 500
+
+@app.route('/api/search/<search_id>/results', methods=['GET'])
+def search_results_page(search_id):
+    """Page through a recent search's results (?cursor=&limit=&all=1&format=compact)"""
+    results = search_results.get(search_id)
+    if results is None:
+        return jsonify({'error': 'Search not found or expired'}), 404
+    
+    try:
+        cursor = int(request.args.get('cursor', 0))
+        limit = min(max(int(request.args.get('limit', 100)), 1), RESULTS_PAGE_MAX)
+        result_format = result_format_arg(request.args.get('format'))
+    except ValueError as e:
+        return jsonify({'error': f'Invalid paging options: {e}'}), 400
+    verified_only = request.args.get('all', '0') not in ('1', 'true')
+    
+    rows, next_cursor = results.page(cursor, limit, verified_only)
+    return json_response({'search_id': search_id, 'results': results.encode(rows, result_format), 'next_cursor': next_cursor})
+
+@app.route('/api/search/stream', methods=['POST'])
+def search_username_stream():
+    """Streaming username search: one event per check as it completes, then the summary.
+    
+    Sends NDJSON by default, or Server-Sent Events when the client asks for
+    text/event-stream. Events are {"type": "start"}, {"type": "result"} for
+    every check (with a "verified" flag and the current total_checks, which
+    grows as variation waves are queued) and a final {"type": "summary"}.
+    """
+    try:
+        data = request.get_json()
+        deadline = search_deadline(data)
+        username, include_variations, usernames_to_check = parse_search_request(data)
+    except Exception as e:
+        logger.error(f"Search stream endpoint error: {e}")
+        return jsonify({'error': f'Internal server error: {str(e)}'}), 500
+    
+    if not username:
+        return jsonify({'error': 'Username is required'}), 400
+    
+    use_sse = 'text/event-stream' in request.headers.get('Accept', '')
+    
+    def encode(event):
+        if use_sse:
+            return f"event: {event['type']}\ndata: {json_dumps(event)}\n\n"
+        return json_dumps(event) + '\n'
+    
+    def generate():
+        logger.info(f"Starting streaming search for username: {username}")
+        SEARCHES_TOTAL.inc(endpoint='stream')
+        expander = VariationExpander(usernames_to_check)
+        summary = SearchSummary(username, usernames_to_check, include_variations, keep_results=False)
+        
+        yield encode({'type': 'start', 'username': username, 'total_checks': expander.planned})
+        try:
+            for result in iter_check_results(expander.first_wave, deadline, expander.follow_up):
+                verified = summary.add(result)
+                # total_checks grows as variation waves are queued
+                yield encode({'type': 'result', 'verified': verified, 'result': result, 'total_checks': expander.planned})
+        except Exception as e:
+            logger.error(f"Search stream error: {e}")
+            yield encode({'type': 'error', 'error': f'Internal server error: {str(e)}'})
+            return
+        
+        logger.info(f"Streaming search complete: {summary.total_found} verified profiles found")
+        yield encode(dict({'type': 'summary'}, **summary.to_dict()))
+    
+    mimetype = 'text/event-stream' if use_sse else 'application/x-ndjson'
+    return Response(stream_with_context(generate()), mimetype=mimetype, headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'  # Stop reverse proxies from buffering the stream
+    })
+
+@app.route('/api/jobs', methods=['POST'])
+def create_job():
+    """Submit a bulk search job for a list of usernames"""
+    try:
+        data = request.get_json() or {}
+        usernames, error = parse_username_list(data)
+        if error:
+            return jsonify({'error': error}), 400
+        include_variations = data.get('includeVariations', False)
+        
+        job_id, total_checks, duplicates_removed = job_queue.create_job(usernames, include_variations)
+        job_runner.ensure_started()
+        logger.info(f"Queued job {job_id}: {len(usernames)} usernames, {total_checks} checks ({duplicates_removed} duplicates removed)")
+        
+        return jsonify({
+            'job_id': job_id,
+            'total_checks': total_checks,
+            'duplicates_removed': duplicates_removed,
+            'status_url': f'/api/jobs/{job_id}',
+            'results_url': f'/api/jobs/{job_id}/results'
+        }), 202
+    
+    except Exception as e:
+        logger.error(f"Job submission error: {e}")
+        return jsonify({'error': f'Internal server error: {str(e)}'}), 500
+
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def job_status(job_id):
+    """Progress of a bulk search job"""
+    progress = job_queue.progress(job_id)
+    if progress is None:
+        return jsonify({'error': 'Job not found'}), 404
+    if progress['status'] in ('queued', 'running'):
+        job_runner.ensure_started()  # Resume jobs left behind by a restarted worker
+    return jsonify(progress)
+
+@app.route('/api/jobs/<job_id>', methods=['DELETE'])
+def cancel_job(job_id):
+    """Cancel a bulk search job's remaining checks"""
+    if not job_queue.cancel(job_id):
+        return jsonify({'error': 'Job not found'}), 404
+    return jsonify(job_queue.progress(job_id))
+
+@app.route('/api/jobs/<job_id>/results', methods=['GET'])
+def job_results(job_id):
+    """Page through a job's results (verified only unless all=1, format=compact for interned rows)"""
+    if job_queue.progress(job_id) is None:
+        return jsonify({'error': 'Job not found'}), 404
+    
+    try:
+        cursor = int(request.args.get('cursor', 0))
+        limit = min(max(int(request.args.get('limit', 100)), 1), RESULTS_PAGE_MAX)
+        result_format = result_format_arg(request.args.get('format'))
+    except ValueError as e:
+        return jsonify({'error': f'Invalid paging options: {e}'}), 400
+    verified_only = request.args.get('all', '0') not in ('1', 'true')
+    
+    stored, next_cursor = job_queue.results(job_id, cursor, limit, verified_only, raw=True)
+    if result_format == 'compact':
+        results = ResultColumns()
+        for result in stored:
+            results.append(json.loads(result) if orjson is None else orjson.loads(result))
+        return json_response({'job_id': job_id, 'results': results.to_compact(results.rows), 'next_cursor': next_cursor})
+    
+    # Stored results are already JSON: splice them in rather than decoding and re-encoding each one
+    body = '{"job_id":%s,"results":[%s],"next_cursor":%s}' % (json_dumps(job_id), ','.join(stored), json_dumps(next_cursor))
+    return body_response(body.encode('utf-8'))
+
+@app.route('/api/watchlist', methods=['POST'])
+def add_to_watchlist():
+    """Watch usernames for status changes on every platform"""
+    try:
+        data = request.get_json() or {}
+        usernames, error = parse_username_list(data)
+        if error:
+            return jsonify({'error': error}), 400
+        include_variations = data.get('includeVariations', False)
+        
+        added, already_watched = watchlist.add(usernames, include_variations)
+        return jsonify({'added': added, 'already_watched': already_watched, 'watchlist': watchlist.overview()}), 201
+    
+    except Exception as e:
+        logger.error(f"Watchlist error: {e}")
+        return jsonify({'error': f'Internal server error: {str(e)}'}), 500
+
+@app.route('/api/watchlist', methods=['GET'])
+def watchlist_overview():
+    """Watchlist size, due entries and the last scan (?username= lists one username's entries)"""
+    overview = watchlist.overview(request.args.get('username'))
+    overview['last_scan'] = watchlist_scanner.last_scan
+    return jsonify(overview)
+
+@app.route('/api/watchlist/<username>', methods=['DELETE'])
+def remove_from_watchlist(username):
+    """Stop watching a username"""
+    removed = watchlist.remove(username)
+    if not removed:
+        return jsonify({'error': 'Username not watched'}), 404
+    return jsonify({'removed': removed})
+
+@app.route('/api/watchlist/scan', methods=['POST'])
+def scan_watchlist():
+    """Start re-checking the watchlist entries that are due"""
+    started = watchlist_scanner.start()
+    return jsonify({'started': started, 'scan': watchlist_scanner.last_scan}), 202 if started else 409
+
+@app.route('/api/watchlist/changes', methods=['GET'])
+def watchlist_changes():
+    """Page through detected status and evidence changes (?cursor=&limit=)"""
+    try:
+        cursor = int(request.args.get('cursor', 0))
+        limit = min(max(int(request.args.get('limit', 100)), 1), 1000)
+    except ValueError:
+        return jsonify({'error': 'cursor and limit must be integers'}), 400
+    
+    changes, next_cursor = watchlist.changes(cursor, limit)
+    return json_response({'changes': changes, 'next_cursor': next_cursor})
+
+@app.route('/metrics', methods=['GET'])
+def prometheus_metrics():
+    """Prometheus metrics for this worker process"""
+    for engine_name, engine in (('async', async_engine), ('threads', thread_engine)):
+        if engine is None:
+            continue
+        capacity = engine.max_concurrency if engine_name == 'async' else engine.max_workers
+        ENGINE_CAPACITY.set(capacity, engine=engine_name)
+        ENGINE_SATURATION.set(round(engine.in_flight / capacity, 4) if capacity else 0, engine=engine_name)
+    
+    pool_hosts = get_verification_engine().stats().get('hosts', {})
+    for host, counts in pool_hosts.items():
+        POOL_CONNECTIONS.set(counts.get('connections_opened', 0), host=host)
+    
+    return Response(metrics.render(), mimetype='text/plain; version=0.0.4')
 
 @app.route('/api/health', methods=['GET'])
 def health_check():
@@ -423,7 +3212,14 @@ def health_check():
     return jsonify({
         'status': 'healthy', 
         'message': 'OSINT Username Hunter API is running',
-        'platforms': sum(len(platforms) for platforms in PLATFORMS.values()),
+        'platforms': len(platform_registry),
+        'engine': 'process' if WORKER_MODE == 'process' else 'async' if get_verification_engine() is async_engine else 'threads',
+        'connection_pool': get_verification_engine().stats(),
+        'rate_limits': rate_scheduler.stats(),
+        'latency': latency_tracker.stats(),
+        'circuit_breakers': circuit_breaker.stats(),
+        'cache': result_cache.stats(),
+        'coalescing': single_flight.stats(),
         'version': '1.0.0'
     })
 
@@ -435,9 +3231,19 @@ def home():
         'version': '1.0.0',
         'endpoints': {
             '/api/health': 'Health check',
-            '/api/search': 'POST - Search usernames'
+            '/metrics': 'Prometheus metrics',
+            '/api/search': 'POST - Search usernames (includeAll, format, limit)',
+            '/api/search/<search_id>/results': 'GET - Page through a recent search\'s results (?cursor=&limit=&all=1&format=compact)',
+            '/api/search/stream': 'POST - Search usernames, streaming each result (NDJSON or SSE)',
+            '/api/jobs': 'POST - Submit a bulk search job for a list of usernames',
+            '/api/jobs/<job_id>': 'GET - Job progress, DELETE - Cancel job',
+            '/api/jobs/<job_id>/results': 'GET - Page through job results (?cursor=&limit=&all=1&format=compact)',
+            '/api/watchlist': 'POST - Watch usernames, GET - Watchlist overview (?username=)',
+            '/api/watchlist/<username>': 'DELETE - Stop watching a username',
+            '/api/watchlist/scan': 'POST - Re-check due watchlist entries in the background',
+            '/api/watchlist/changes': 'GET - Page through detected status and evidence changes (?cursor=&limit=)'
         },
-        'platforms_supported': sum(len(platforms) for platforms in PLATFORMS.values())
+        'platforms_supported': len(platform_registry)
     })
 
 if __name__ == '__main__':
@@ -450,11 +3256,11 @@ if __name__ == '__main__':
     if not is_production:
         # Local development messages
         print("🚀 Starting OSINT Username Hunter Backend...")
-        print(f"📊 Platforms configured: {sum(len(platforms) for platforms in PLATFORMS.values())}")
+        print(f"📊 Platforms configured: {len(platform_registry)}")
         print("🌐 Server starting on http://localhost:5000")
         print("💡 Frontend should connect automatically")
         print("\n📋 Required packages:")
-        print("   pip install flask flask-cors requests beautifulsoup4 user-agent")
+        print("   pip install flask flask-cors requests beautifulsoup4 user-agent aiohttp")
         print("\n🔍 Usage:")
         print("   1. Keep this running")
         print("   2. Open index.html in your browser")
@@ -463,7 +3269,7 @@ if __name__ == '__main__':
     else:
         # Production messages
         print("🚀 OSINT Username Hunter Backend starting on Render...")
-        print(f"📊 Platforms configured: {sum(len(platforms) for platforms in PLATFORMS.values())}")
+        print(f"📊 Platforms configured: {len(platform_registry)}")
     
     try:
         # Use 0.0.0.0 host for production, debug=False for production